@@ -1,7 +1,8 @@
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from common.base_agent import BaseAgent, utc_now_iso
+from common.base_agent import BaseAgent, run_now_iso
+from common.schemas import AuditEntry
 from common.artifacts import write_json, artifact_ref
 from common.policy import assert_allowed
 
@@ -28,7 +29,7 @@ class TemplateAgent(BaseAgent):
         payload: Dict[str, Any],
         run_config: Dict[str, Any],
         artifact_dir: Path
-    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[AuditEntry]]:
 
         # Example: if this agent would send an email, enforce policy:
         # assert_allowed(run_config, "send_email")
@@ -38,18 +39,19 @@ class TemplateAgent(BaseAgent):
 
         processed_value = str(payload["example_input"]).upper()
 
+        now = run_now_iso(run_config)
         data = {
             "input_received": payload["example_input"],
             "processed_value": processed_value,
             "mode": run_config.get("mode", "TEST"),
             "network": run_config.get("network", "OFF"),
-            "timestamp": utc_now_iso(),
+            "timestamp": now,
         }
 
         out_path = artifact_dir / "output.json"
-        write_json(out_path, data)
+        digest = write_json(out_path, data)
 
-        artifacts = [artifact_ref(out_path, "json", "processed_output")]
-        audit = [{"action": "process_input", "object": "example_input", "result": "ok", "ts": utc_now_iso()}]
+        artifacts = [artifact_ref(out_path, "json", "processed_output", sha256=digest)]
+        audit = [AuditEntry("process_input", "example_input", "ok", now)]
 
         return data, artifacts, audit
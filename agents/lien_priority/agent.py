@@ -1,10 +1,14 @@
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from common.base_agent import BaseAgent, utc_now_iso
+from common.base_agent import BaseAgent, run_now_iso
+from common.schemas import AuditEntry
 from common.artifacts import write_json, artifact_ref
 
 
+_MORTGAGE_TYPES = frozenset({"mortgage", "deed of trust"})
+
+
 class LienPriorityVerificationAgent(BaseAgent):
     """
     Produces a structured 'priority_result' from known lien/mortgage/creditor inputs.
@@ -23,19 +27,14 @@ class LienPriorityVerificationAgent(BaseAgent):
     def __init__(self, fixtures: Optional[Any] = None):
         self.fixtures = fixtures
 
-    def _run(self, payload: Dict[str, Any], run_config: Dict[str, Any], artifact_dir: Path) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    def _run(self, payload: Dict[str, Any], run_config: Dict[str, Any], artifact_dir: Path) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[AuditEntry]]:
         program = (payload.get("program") or "TSSF").upper()
         liens = payload.get("liens") or []
         if not isinstance(liens, list):
             raise ValueError("payload.liens must be a list")
 
-        total_liens = 0.0
-        has_mortgage = False
-        for l in liens:
-            amt = float(l.get("amount") or 0.0)
-            total_liens += max(amt, 0.0)
-            if str(l.get("type") or "").lower() in ("mortgage", "deed of trust"):
-                has_mortgage = True
+        total_liens = sum((max(float(l.get("amount") or 0.0), 0.0) for l in liens), 0.0)
+        has_mortgage = any(str(l.get("type") or "").lower() in _MORTGAGE_TYPES for l in liens)
 
         # v0 heuristic outcomes
         if program == "TSSF":
@@ -46,6 +45,7 @@ class LienPriorityVerificationAgent(BaseAgent):
             status = "ok" if creditor.get("name") else "needs_creditor_info"
             notes = "SCP50 requires creditor priority claim; v0 validates presence only."
 
+        now = run_now_iso(run_config)
         data = {
             "program": program,
             "liens_count": len(liens),
@@ -53,12 +53,12 @@ class LienPriorityVerificationAgent(BaseAgent):
             "has_mortgage": has_mortgage,
             "priority_status": status,
             "notes": notes,
-            "ts": utc_now_iso(),
+            "ts": now,
         }
 
         out = artifact_dir / "priority_result.json"
-        write_json(out, data)
+        digest = write_json(out, data)
 
-        artifacts = [artifact_ref(out, "json", "priority_result")]
-        audit = [{"action": "verify_lien_priority", "object": "case", "result": "ok", "ts": utc_now_iso()}]
+        artifacts = [artifact_ref(out, "json", "priority_result", sha256=digest)]
+        audit = [AuditEntry("verify_lien_priority", "case", "ok", now)]
         return data, artifacts, audit
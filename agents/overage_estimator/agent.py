@@ -1,7 +1,8 @@
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from common.base_agent import BaseAgent, utc_now_iso
+from common.base_agent import BaseAgent, run_now_iso
+from common.schemas import AuditEntry
 from common.artifacts import write_json, artifact_ref
 
 
@@ -29,19 +30,22 @@ class OveragesEstimationAgent(BaseAgent):
     def __init__(self, fixtures: Optional[Any] = None):
         self.fixtures = fixtures
 
-    def _run(self, payload: Dict[str, Any], run_config: Dict[str, Any], artifact_dir: Path) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]:
-        sale_price = float(payload.get("sale_price") or 0.0)
-        judgment = float(payload.get("judgment_amount") or 0.0)
-        liens = float(payload.get("known_liens_total") or 0.0)
-        fees = float(payload.get("fees_estimate") or 0.0)
+    def _run(self, payload: Dict[str, Any], run_config: Dict[str, Any], artifact_dir: Path) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[AuditEntry]]:
+        g = payload.get
+        sale_price, judgment, liens, fees = (
+            float(g("sale_price") or 0.0),
+            float(g("judgment_amount") or 0.0),
+            float(g("known_liens_total") or 0.0),
+            float(g("fees_estimate") or 0.0),
+        )
 
-        est = sale_price - judgment - liens - fees
-        est = max(est, 0.0)
+        est = max(sale_price - judgment - liens - fees, 0.0)
 
-        inputs_present = sum(1 for x in [sale_price, judgment, liens, fees] if x > 0)
+        inputs_present = (sale_price > 0) + (judgment > 0) + (liens > 0) + (fees > 0)
         confidence = 0.25 + 0.15 * inputs_present  # 0.40–0.85 typical v0
         confidence = min(confidence, 0.90)
 
+        now = run_now_iso(run_config)
         data = {
             "sale_price": sale_price,
             "judgment_amount": judgment,
@@ -49,12 +53,12 @@ class OveragesEstimationAgent(BaseAgent):
             "fees_estimate": fees,
             "estimated_overage": est,
             "confidence": confidence,
-            "ts": utc_now_iso(),
+            "ts": now,
         }
 
         out = artifact_dir / "overage_estimate.json"
-        write_json(out, data)
+        digest = write_json(out, data)
 
-        artifacts = [artifact_ref(out, "json", "overage_estimate")]
-        audit = [{"action": "estimate_overage", "object": "case", "result": "ok", "ts": utc_now_iso()}]
+        artifacts = [artifact_ref(out, "json", "overage_estimate", sha256=digest)]
+        audit = [AuditEntry("estimate_overage", "case", "ok", now)]
         return data, artifacts, audit
@@ -1,16 +1,109 @@
+import html as htmllib
+import io
+import re
+import shutil
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from common.base_agent import BaseAgent, utc_now_iso
+from common.base_agent import BaseAgent, run_now_iso
+from common.schemas import AuditEntry
 from common.artifacts import write_json, artifact_ref, write_text
 from common.http_client import HttpClient
 from common.fixtures import FixtureStore
 
+try:
+    from selectolax.lexbor import LexborHTMLParser  # type: ignore
+except Exception:
+    LexborHTMLParser = None
+
+try:
+    from lxml import etree  # type: ignore
+except Exception:
+    etree = None
+
 try:
     from bs4 import BeautifulSoup  # type: ignore
 except Exception:
     BeautifulSoup = None
 
+_DL_SUFFIXES = (".pdf", ".csv", ".xlsx", ".xls")
+
+# Output caps, enforced while parsing so oversized pages stay bounded.
+_LINK_CAP = 200
+_ROW_CAP = 500
+
+# Table-less pages skip DOM construction: links come from a regex scan. One
+# pass matches, in document order, comments and raw-text elements (skipped, as
+# a parser would not see tags inside them) and <a> start tags (attributes kept).
+_TABLE_RE = re.compile(r"<table[\s>]", re.IGNORECASE)
+_ATTRS = r"""[^>"']*(?:(?:"[^"]*"|'[^']*')[^>"']*)*"""  # unrolled: no backtracking blowup
+_SCAN_RE = re.compile(
+    r"<(?:!--.*?(?:-->|\Z)"
+    rf"|(script|style|textarea|title)(?=[\s/>]){_ATTRS}>.*?(?:</\1\s*>|\Z)"
+    rf"|a(?=[\s/>])({_ATTRS})>)",
+    re.IGNORECASE | re.DOTALL,
+)
+# First href attribute in an <a> tag's attribute text. Attributes before it are
+# skipped whole (quoted values included), so data-href or a quoted "href=" is
+# never taken for it.
+_HREF_RE = re.compile(
+    r"""(?:\s+[^\s"'>=]+(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s>]+))?)*?"""
+    r"""\s+href(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+)))?(?![^\s>])""",
+    re.IGNORECASE,
+)
+
+# Elements whose text bs4's get_text() leaves out (bs4 stores it as
+# Script/Stylesheet/TemplateString/Ruby*String, not NavigableString).
+_NON_TEXT_TAGS = ("script", "style", "template", "rt", "rp")
+_NON_TEXT_CSS = ",".join(_NON_TEXT_TAGS)
+
+
+def _href(attrs: str) -> str:
+    """Value of the first href attribute in an <a> tag's attribute text."""
+    m = _HREF_RE.match(attrs)
+    href = (m.group(1) or m.group(2) or m.group(3) or "") if m else ""
+    return htmllib.unescape(href) if "&" in href else href
+
+
+def _lexbor_text(node: Any) -> str:
+    """Match bs4's get_text(" ", strip=True): whitespace-only and script/style text is dropped."""
+    if node.css_first(_NON_TEXT_CSS) is None:
+        return " ".join(p for p in node.text(separator="\x1f", strip=True).split("\x1f") if p)
+    parts: List[str] = []
+
+    def walk(n: Any) -> None:
+        for child in n.iter(include_text=True):
+            if child.is_text_node:
+                text = child.text(deep=False).strip()
+                if text:
+                    parts.append(text)
+            elif child.is_element_node and child.tag not in _NON_TEXT_TAGS:
+                walk(child)
+
+    walk(node)
+    return " ".join(parts)
+
+
+def _lxml_text(el: Any) -> str:
+    """Match bs4's get_text(" ", strip=True) on an lxml element."""
+    if next(el.iterancestors(*_NON_TEXT_TAGS), None) is not None:
+        return ""
+    parts: List[str] = []
+
+    def walk(node: Any) -> None:
+        # Comments/PIs have a non-str tag; their text is skipped, their tail is not
+        if not isinstance(node.tag, str) or node.tag in _NON_TEXT_TAGS:
+            return
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            walk(child)
+            if child.tail:
+                parts.append(child.tail)
+
+    walk(el)
+    return " ".join(t for t in (p.strip() for p in parts) if t)
+
 
 class ScraperFOIAAgent(BaseAgent):
     """
@@ -34,7 +127,7 @@ class ScraperFOIAAgent(BaseAgent):
         payload: Dict[str, Any],
         run_config: Dict[str, Any],
         artifact_dir: Path
-    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[AuditEntry]]:
 
         network = run_config.get("network", "OFF")
         seed_url = payload.get("seed_url")
@@ -47,46 +140,175 @@ class ScraperFOIAAgent(BaseAgent):
         html = http.get_text(url=seed_url or "https://example.invalid", fixture_key=fixture_key)
 
         raw_path = artifact_dir / "raw.html"
-        write_text(raw_path, html)
+        raw_digest = None
+        if network == "OFF":
+            # The snapshot is the fixture itself: copy its bytes kernel-side rather
+            # than re-encoding the decoded text. A copy (not a hardlink) keeps the
+            # artifact immutable if the fixture is edited later.
+            shutil.copyfile(self._fixtures.path(fixture_key), raw_path)
+        else:
+            raw_digest = write_text(raw_path, html)
 
         links: List[str] = []
         rows: List[Dict[str, Any]] = []
         parse_note = "bs4 not installed"
 
-        if BeautifulSoup is not None:
+        if not _TABLE_RE.search(html):
             parse_note = "ok"
-            soup = BeautifulSoup(html, "lxml") if "lxml" in str(type(BeautifulSoup)) else BeautifulSoup(html, "html.parser")
-
-            for a in soup.find_all("a"):
-                href = a.get("href") or ""
-                if any(href.lower().endswith(ext) for ext in (".pdf", ".csv", ".xlsx", ".xls")):
-                    links.append(href)
-
-            # Very basic: parse first table if present
-            table = soup.find("table")
-            if table:
-                headers = [th.get_text(" ", strip=True) for th in table.find_all("th")]
-                for tr in table.find_all("tr"):
-                    tds = [td.get_text(" ", strip=True) for td in tr.find_all("td")]
-                    if headers and tds and len(tds) <= len(headers):
-                        row = {headers[i]: tds[i] for i in range(len(tds))}
-                        rows.append(row)
+            links = self._scan_links(html)
+        elif LexborHTMLParser is not None:
+            parse_note = "ok"
+            links, rows = self._parse_lexbor(html)
+        elif etree is not None:
+            parse_note = "ok"
+            links, rows = self._parse_lxml(html)
+        elif BeautifulSoup is not None:
+            parse_note = "ok"
+            links, rows = self._parse_bs4(html)
 
+        now = run_now_iso(run_config)
         data = {
             "seed_url": seed_url,
             "network": network,
             "parse_note": parse_note,
-            "download_links": links[:200],
-            "table_rows": rows[:500],
-            "ts": utc_now_iso(),
+            "download_links": links,
+            "table_rows": rows,
+            "ts": now,
         }
 
         out = artifact_dir / "scrape_result.json"
-        write_json(out, data)
+        digest = write_json(out, data)
 
         artifacts = [
-            artifact_ref(raw_path, "html", "raw_html_snapshot"),
-            artifact_ref(out, "json", "scrape_result"),
+            artifact_ref(raw_path, "html", "raw_html_snapshot", sha256=raw_digest),
+            artifact_ref(out, "json", "scrape_result", sha256=digest),
         ]
-        audit = [{"action": "scrape_or_fixture_load", "object": "source_site", "result": "ok", "ts": utc_now_iso()}]
+        audit = [AuditEntry("scrape_or_fixture_load", "source_site", "ok", now)]
         return data, artifacts, audit
+
+    @staticmethod
+    def _scan_links(html: str) -> List[str]:
+        """Download links without building a DOM; used when the page has no table."""
+        links: List[str] = []
+        for m in _SCAN_RE.finditer(html):
+            attrs = m.group(2)
+            if attrs is None:
+                continue  # comment, script, style, ...
+            if "&" not in attrs:
+                lowered = attrs.lower()
+                if not any(suffix in lowered for suffix in _DL_SUFFIXES):
+                    continue  # cannot be a download link
+            href = _href(attrs)
+            if href.lower().endswith(_DL_SUFFIXES):
+                links.append(href)
+                if len(links) >= _LINK_CAP:
+                    break
+        return links
+
+    @staticmethod
+    def _parse_lexbor(html: str) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """
+        C-backed parse (selectolax/lexbor), the default table-page parser.
+
+        Lexbor builds the HTML5 tree, so on malformed markup its output differs
+        from _parse_lxml/_parse_bs4: misnested <a>s are cloned (and reported
+        again) and stray cells open rows of their own.
+        """
+        links: List[str] = []
+        rows: List[Dict[str, Any]] = []
+        tree = LexborHTMLParser(html)
+
+        for a in tree.css("a"):
+            href = a.attributes.get("href") or ""
+            if href.lower().endswith(_DL_SUFFIXES):
+                links.append(href)
+                if len(links) >= _LINK_CAP:
+                    break
+
+        # Very basic: parse first table if present
+        table = tree.css_first("table")
+        if table is not None:
+            headers = [_lexbor_text(th) for th in table.css("th")]
+            for tr in table.css("tr"):
+                tds = [_lexbor_text(td) for td in tr.css("td")]
+                if headers and tds and len(tds) <= len(headers):
+                    row = {headers[i]: tds[i] for i in range(len(tds))}
+                    rows.append(row)
+                    if len(rows) >= _ROW_CAP:
+                        break
+
+        return links, rows
+
+    @staticmethod
+    def _parse_lxml(html: str) -> Tuple[List[str], List[Dict[str, Any]]]:
+        """Single streaming pass with lxml's C parser; links are in document order."""
+        links: List[str] = []
+        rows: List[Dict[str, Any]] = []
+        if not html.strip():
+            return links, rows
+
+        have_table = False
+        events = etree.iterparse(
+            io.BytesIO(html.encode("utf-8")),
+            events=("start", "end"),
+            tag=("a", "table"),
+            html=True,
+            encoding="utf-8",
+        )
+        for event, el in events:
+            # Anchors on start (nested ones end first), tables on end (rows parsed)
+            if el.tag == "a":
+                if event == "start" and len(links) < _LINK_CAP:
+                    href = el.get("href") or ""
+                    if href.lower().endswith(_DL_SUFFIXES):
+                        links.append(href)
+                continue
+            if event == "start":
+                continue
+
+            # Nested tables end before their parent; only outermost tables count.
+            if next(el.iterancestors("table"), None) is not None:
+                continue
+            if not have_table:
+                # Very basic: parse first table if present
+                have_table = True
+                headers = [_lxml_text(th) for th in el.iter("th")]
+                for tr in el.iter("tr"):
+                    tds = [_lxml_text(td) for td in tr.iter("td")]
+                    if headers and tds and len(tds) <= len(headers):
+                        row = {headers[i]: tds[i] for i in range(len(tds))}
+                        rows.append(row)
+                        if len(rows) >= _ROW_CAP:
+                            break
+            # Links inside have already been seen; drop the subtree.
+            el.clear(keep_tail=True)
+
+        return links, rows
+
+    @staticmethod
+    def _parse_bs4(html: str) -> Tuple[List[str], List[Dict[str, Any]]]:
+        links: List[str] = []
+        rows: List[Dict[str, Any]] = []
+        # Only reached without lxml, so bs4's lxml tree builder is never available here
+        soup = BeautifulSoup(html, "html.parser")
+
+        for a in soup.find_all("a"):
+            href = a.get("href") or ""
+            if href.lower().endswith(_DL_SUFFIXES):
+                links.append(href)
+                if len(links) >= _LINK_CAP:
+                    break
+
+        # Very basic: parse first table if present
+        table = soup.find("table")
+        if table:
+            headers = [th.get_text(" ", strip=True) for th in table.find_all("th")]
+            for tr in table.find_all("tr"):
+                tds = [td.get_text(" ", strip=True) for td in tr.find_all("td")]
+                if headers and tds and len(tds) <= len(headers):
+                    row = {headers[i]: tds[i] for i in range(len(tds))}
+                    rows.append(row)
+                    if len(rows) >= _ROW_CAP:
+                        break
+
+        return links, rows
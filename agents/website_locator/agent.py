@@ -1,11 +1,20 @@
+import re
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-from common.base_agent import BaseAgent, utc_now_iso
+from common.base_agent import BaseAgent, run_now_iso
+from common.schemas import AuditEntry
 from common.artifacts import write_json, artifact_ref
 from common.http_client import HttpClient
 from common.fixtures import FixtureStore
 
+# Known official-site tokens -> candidate URL. All tokens are matched in a
+# single compiled scan, so adding entries does not add passes over the HTML.
+_KNOWN_SITES: Dict[str, str] = {
+    "example.gov": "https://example.gov/clerk",
+}
+_KNOWN_SITES_RE = re.compile("|".join(re.escape(t) for t in _KNOWN_SITES))
+
 
 class WebsiteLocatorAgent(BaseAgent):
     """
@@ -29,7 +38,7 @@ class WebsiteLocatorAgent(BaseAgent):
         payload: Dict[str, Any],
         run_config: Dict[str, Any],
         artifact_dir: Path
-    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[AuditEntry]]:
 
         network = run_config.get("network", "OFF")
         http = HttpClient(network=network, fixtures=self._fixtures)
@@ -40,24 +49,27 @@ class WebsiteLocatorAgent(BaseAgent):
         # Very simple heuristic extraction for v0
         # (Use BeautifulSoup later; keep dependency minimal for template.)
         candidates = []
-        if "example.gov" in html:
-            candidates.append({"url": "https://example.gov/clerk", "confidence": 0.60, "reason": "matched example.gov token"})
+        m = _KNOWN_SITES_RE.search(html)
+        if m:
+            token = m.group(0)
+            candidates.append({"url": _KNOWN_SITES[token], "confidence": 0.60, "reason": f"matched {token} token"})
         else:
             candidates.append({"url": payload.get("seed_url", ""), "confidence": 0.25, "reason": "fallback seed_url"})
 
+        now = run_now_iso(run_config)
         data = {
             "courthouse_name": payload.get("courthouse_name"),
             "courthouse_address": payload.get("courthouse_address"),
             "seed_url": payload.get("seed_url"),
             "network": network,
             "candidates": candidates,
-            "ts": utc_now_iso(),
+            "ts": now,
         }
 
         out = artifact_dir / "candidate_sites.json"
-        write_json(out, data)
+        digest = write_json(out, data)
 
-        artifacts = [artifact_ref(out, "json", "candidate_sites")]
-        audit = [{"action": "derive_sites", "object": "courthouse", "result": "ok", "ts": utc_now_iso()}]
+        artifacts = [artifact_ref(out, "json", "candidate_sites", sha256=digest)]
+        audit = [AuditEntry("derive_sites", "courthouse", "ok", now)]
 
         return data, artifacts, audit
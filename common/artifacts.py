@@ -1,22 +1,41 @@
 import hashlib
 import json
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+_ORJSON_OPTS = (orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS) if orjson is not None else 0
 
 def sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
     with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+: the read/update loop runs in C.
+            return hashlib.file_digest(f, "sha256").hexdigest()
+        h = hashlib.sha256()
+        buf = memoryview(bytearray(1024 * 1024))
+        while n := f.readinto(buf):
+            h.update(buf[:n])
     return h.hexdigest()
 
-def write_json(path: Path, obj: Any) -> None:
+def write_bytes(path: Path, data: bytes) -> str:
+    """Write data and return its SHA-256, hashed from memory rather than re-read from disk."""
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(obj, indent=2, ensure_ascii=False), encoding="utf-8")
+    path.write_bytes(data)
+    return hashlib.sha256(data).hexdigest()
 
-def write_text(path: Path, text: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(text, encoding="utf-8")
+def write_json(path: Path, obj: Any) -> str:
+    if orjson is not None:
+        # orjson emits UTF-8 bytes directly; one C-level encode + one write.
+        return write_bytes(path, orjson.dumps(obj, option=_ORJSON_OPTS))
+    return write_bytes(path, json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8"))
+
+def write_text(path: Path, text: str) -> str:
+    return write_bytes(path, text.encode("utf-8"))
 
-def artifact_ref(path: Path, type_: str, label: str = "") -> Dict[str, Any]:
-    return {"type": type_, "path": str(path), "sha256": sha256_file(path), "label": label}
+def artifact_ref(path: Path, type_: str, label: str = "", sha256: Optional[str] = None) -> Dict[str, Any]:
+    # Pass the digest returned by write_* to skip re-reading the file.
+    return {"type": type_, "path": str(path), "sha256": sha256 or sha256_file(path), "label": label}
@@ -1,12 +1,29 @@
 import time
 import uuid
-from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+from surplus_agents.core.timeutils import utc_now_iso
 
 from .artifacts import write_json, artifact_ref
+from .schemas import AuditEntry
 from .validate import validate_result
 
+# artifact_root/agent_name directories already created in this process.
+_ensured_parents: Set[Path] = set()
+
+def _ensure_artifact_dir(artifact_dir: Path) -> None:
+    parent = artifact_dir.parent
+    if parent in _ensured_parents:
+        try:
+            artifact_dir.mkdir(exist_ok=True)
+            return
+        except FileNotFoundError:
+            pass  # parent was removed since it was cached; recreate below
+    artifact_dir.mkdir(parents=True, exist_ok=True)
+    _ensured_parents.add(parent)
+
 class BaseAgent:
     """
     Production-aligned base agent:
@@ -21,7 +38,11 @@ class BaseAgent:
 
     def run(self, payload: Dict[str, Any], run_config: Dict[str, Any]) -> Dict[str, Any]:
         run_id = run_config.get("run_id") or str(uuid.uuid4())
-        t0 = time.time()
+        t0 = time.perf_counter_ns()
+
+        # One timestamp per run; agents read it via run_now_iso(run_config).
+        run_config = dict(run_config)
+        run_config.setdefault("_now_iso", utc_now_iso())
 
         artifacts: List[Dict[str, Any]] = []
         audit: List[Dict[str, Any]] = []
@@ -29,12 +50,13 @@ class BaseAgent:
 
         artifact_root = Path(run_config.get("artifact_dir", "./artifacts"))
         artifact_dir = artifact_root / self.agent_name / run_id
-        artifact_dir.mkdir(parents=True, exist_ok=True)
+        _ensure_artifact_dir(artifact_dir)
 
         try:
             data, artifacts2, audit2 = self._run(payload, run_config, artifact_dir)
             artifacts.extend(artifacts2 or [])
-            audit.extend(audit2 or [])
+            # Agents may emit slotted AuditEntry objects; results carry plain dicts.
+            audit.extend(a.to_dict() if isinstance(a, AuditEntry) else a for a in audit2 or ())
             status = "ok"
         except PermissionError as e:
             data = {}
@@ -45,7 +67,7 @@ class BaseAgent:
             status = "error"
             errors.append({"code": "UNHANDLED", "message": str(e), "details": {}})
 
-        duration_ms = int((time.time() - t0) * 1000)
+        duration_ms = (time.perf_counter_ns() - t0) // 1_000_000
 
         result: Dict[str, Any] = {
             "agent_name": self.agent_name,
@@ -59,12 +81,7 @@ class BaseAgent:
             "errors": errors,
         }
 
-        # Always write result.json
-        result_path = artifact_dir / "result.json"
-        write_json(result_path, result)
-        result["artifacts"].append(artifact_ref(result_path, "json", "agent_result"))
-
-        # Validate schema shape
+        # Validate schema shape in memory so result.json is written exactly once
         schema_errs = validate_result(result)
         if schema_errs:
             result["status"] = "error"
@@ -73,17 +90,55 @@ class BaseAgent:
                 "message": "; ".join(schema_errs),
                 "details": {}
             })
-            write_json(result_path, result)
+
+        # Always write result.json. Its own artifact_ref is only added to the
+        # returned result: a file cannot carry a hash of itself.
+        result_path = artifact_dir / "result.json"
+        digest = write_json(result_path, result)
+        result["artifacts"].append(artifact_ref(result_path, "json", "agent_result", sha256=digest))
 
         return result
 
+    def run_many(
+        self,
+        payloads: Sequence[Dict[str, Any]],
+        run_config: Dict[str, Any],
+        max_workers: Optional[int] = None,
+        executor: str = "process",
+    ) -> List[Dict[str, Any]]:
+        """
+        Run independent payloads in parallel; results keep payload order.
+
+        executor="process" sidesteps the GIL for CPU-bound agents (HTML parsing);
+        executor="thread" suits network-bound runs. The agent instance (and its
+        fixtures) must be picklable for the process pool. A fixed run_id in
+        run_config is suffixed with the payload index so runs don't share a
+        directory.
+        """
+        if executor not in ("process", "thread"):
+            raise ValueError(f"Invalid executor: {executor}. Must be 'process' or 'thread'")
+
+        base_id = run_config.get("run_id")
+        configs = [
+            dict(run_config, run_id=f"{base_id}-{i}") if base_id else run_config
+            for i in range(len(payloads))
+        ]
+        pool_cls = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        with pool_cls(max_workers=max_workers) as pool:
+            return list(pool.map(_run_one, [self] * len(payloads), payloads, configs))
+
     def _run(
         self,
         payload: Dict[str, Any],
         run_config: Dict[str, Any],
         artifact_dir: Path
-    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[Dict[str, Any]]]:
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]], List[Union[AuditEntry, Dict[str, Any]]]]:
         raise NotImplementedError("Subclasses must implement _run().")
 
-def utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat()
+def _run_one(agent: "BaseAgent", payload: Dict[str, Any], run_config: Dict[str, Any]) -> Dict[str, Any]:
+    # Module-level so ProcessPoolExecutor can pickle it.
+    return agent.run(payload, run_config)
+
+def run_now_iso(run_config: Dict[str, Any]) -> str:
+    """Timestamp computed once by BaseAgent.run; falls back to now when _run is called directly."""
+    return run_config.get("_now_iso") or utc_now_iso()
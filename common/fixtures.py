@@ -1,5 +1,11 @@
+from functools import lru_cache
 from pathlib import Path
 
+@lru_cache(maxsize=256)
+def _read_text_cached(path: str, mtime_ns: int, size: int, encoding: str) -> str:
+    # mtime_ns/size are part of the key so an edited fixture is re-read.
+    return Path(path).read_text(encoding=encoding)
+
 class FixtureStore:
     """
     Simple fixture loader for deterministic tests.
@@ -16,7 +22,12 @@ class FixtureStore:
         return p
 
     def read_text(self, relative: str, encoding: str = "utf-8") -> str:
-        return self.path(relative).read_text(encoding=encoding)
+        p = self.root / relative
+        try:
+            st = p.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Fixture not found: {p}") from None
+        return _read_text_cached(str(p.resolve()), st.st_mtime_ns, st.st_size, encoding)
 
     def read_bytes(self, relative: str) -> bytes:
         return self.path(relative).read_bytes()
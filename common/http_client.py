@@ -1,7 +1,54 @@
-from typing import Optional
+import asyncio
+import atexit
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
 import httpx
 from .fixtures import FixtureStore
 
+try:
+    import h2  # type: ignore  # noqa: F401
+    _HTTP2 = True
+except Exception:
+    _HTTP2 = False
+
+# One pooled client per process so keep-alive connections survive across
+# agent runs (each run builds its own HttpClient).
+_client: Optional[httpx.Client] = None
+_client_lock = threading.Lock()
+
+def _shared_client() -> httpx.Client:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = httpx.Client(http2=_HTTP2, follow_redirects=True)
+    return _client
+
+# Clients inherited from the parent by forked children (e.g. run_many's process
+# pool). Kept referenced but never used or closed: their pooled sockets are the
+# parent's connections.
+_inherited_clients: List[httpx.Client] = []
+
+def _reset_after_fork() -> None:
+    global _client, _client_lock
+    if _client is not None:
+        _inherited_clients.append(_client)
+    _client = None
+    _client_lock = threading.Lock()  # may have been held by another parent thread
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
+@atexit.register
+def close_shared_client() -> None:
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
 class HttpClient:
     """
     HTTP client with a fixtures-backed mode.
@@ -19,6 +66,50 @@ class HttpClient:
             if not self.fixtures or not fixture_key:
                 raise RuntimeError("Network OFF requires fixtures + fixture_key.")
             return self.fixtures.read_text(fixture_key)
-        r = httpx.get(url, timeout=timeout, follow_redirects=True)
+        r = _shared_client().get(url, timeout=timeout)
         r.raise_for_status()
         return r.text
+
+    def get_texts(
+        self,
+        urls: List[str],
+        fixture_keys: Optional[List[Optional[str]]] = None,
+        timeout: int = 30,
+        max_concurrency: int = 8,
+    ) -> List[str]:
+        """
+        Batched get_text: results are in the same order as urls.
+
+        - network OFF: one fixture read per (url, fixture_key) pair
+        - network ON: requests overlap on one httpx.AsyncClient,
+          at most max_concurrency in flight
+        """
+        if fixture_keys is not None and len(fixture_keys) != len(urls):
+            raise ValueError("fixture_keys must have one entry per url.")
+        if self.network == "OFF":
+            keys = fixture_keys or [None] * len(urls)
+            return [self.get_text(u, fixture_key=k, timeout=timeout) for u, k in zip(urls, keys)]
+        if not urls:
+            return []
+
+        coro = self._get_texts_async(urls, timeout, max_concurrency)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+        # Already inside an event loop (Colab/Jupyter): run the batch on a worker thread.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, coro).result()
+
+    @staticmethod
+    async def _get_texts_async(urls: List[str], timeout: int, max_concurrency: int) -> List[str]:
+        sem = asyncio.Semaphore(max_concurrency)
+        limits = httpx.Limits(max_keepalive_connections=max_concurrency)
+        async with httpx.AsyncClient(timeout=timeout, follow_redirects=True, limits=limits) as client:
+            async def fetch(url: str) -> str:
+                async with sem:
+                    r = await client.get(url)
+                r.raise_for_status()
+                return r.text
+
+            return list(await asyncio.gather(*(fetch(u) for u in urls)))
@@ -14,6 +14,17 @@ class ArtifactRef:
     label: str = ""
 
 
+@dataclass(frozen=True, slots=True)
+class AuditEntry:
+    action: str
+    object: str
+    result: str
+    ts: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"action": self.action, "object": self.object, "result": self.result, "ts": self.ts}
+
+
 @dataclass
 class AgentResult:
     agent_name: str
@@ -12,31 +12,33 @@ REQUIRED_TOP_KEYS = [
     "errors",
 ]
 
-ALLOWED_STATUS = {"ok", "blocked", "error"}
+ALLOWED_STATUS = frozenset({"ok", "blocked", "error"})
 
-def validate_result(result: Dict[str, Any]) -> List[str]:
-    errs: List[str] = []
-
-    for k in REQUIRED_TOP_KEYS:
-        if k not in result:
-            errs.append(f"Missing key: {k}")
+_REQUIRED = frozenset(REQUIRED_TOP_KEYS)
+_MISSING = object()
 
-    if "status" in result and result["status"] not in ALLOWED_STATUS:
-        errs.append(f"Invalid status: {result.get('status')}")
+# (key, expected type, error message), checked in this order
+_TYPE_CHECKS = (
+    ("artifacts", list, "artifacts must be a list"),
+    ("errors", list, "errors must be a list"),
+    ("audit", list, "audit must be a list"),
+    ("metrics", dict, "metrics must be a dict"),
+    ("data", dict, "data must be a dict"),
+)
 
-    if "artifacts" in result and not isinstance(result["artifacts"], list):
-        errs.append("artifacts must be a list")
-
-    if "errors" in result and not isinstance(result["errors"], list):
-        errs.append("errors must be a list")
+def validate_result(result: Dict[str, Any]) -> List[str]:
+    errs: List[str] = []
 
-    if "audit" in result and not isinstance(result["audit"], list):
-        errs.append("audit must be a list")
+    if not _REQUIRED <= result.keys():
+        errs.extend(f"Missing key: {k}" for k in REQUIRED_TOP_KEYS if k not in result)
 
-    if "metrics" in result and not isinstance(result["metrics"], dict):
-        errs.append("metrics must be a dict")
+    status = result.get("status", _MISSING)
+    if status is not _MISSING and status not in ALLOWED_STATUS:
+        errs.append(f"Invalid status: {status}")
 
-    if "data" in result and not isinstance(result["data"], dict):
-        errs.append("data must be a dict")
+    for key, type_, msg in _TYPE_CHECKS:
+        value = result.get(key, _MISSING)
+        if value is not _MISSING and not isinstance(value, type_):
+            errs.append(msg)
 
     return errs
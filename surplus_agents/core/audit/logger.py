@@ -1,13 +1,97 @@
 """Structured audit logger for tracking all operations."""
 
 import json
-from datetime import datetime, timezone
+import os
+import sys
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass, asdict
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from dataclasses import dataclass
 
+from ..storage import ensure_dir, has_non_finite, loads_json, with_parent
+from ..timeutils import utc_now_iso
 
-@dataclass
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+try:
+    import msgspec  # type: ignore
+except Exception:
+    msgspec = None
+
+# Built once: json.dumps with non-default options constructs a new encoder per call.
+_encode_line = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+# msgspec encodes the slotted AuditEntry dataclasses directly, no to_dict() per entry
+_encode_lines = msgspec.json.Encoder().encode_lines if msgspec is not None else None
+
+
+# os.writev accepts at most IOV_MAX buffers per call.
+_IOV_MAX = min(os.sysconf("SC_IOV_MAX"), 1024) if hasattr(os, "sysconf") else 1024
+
+
+def _write_all(fd: int, bufs: List[bytes]) -> None:
+    """Write buffers in order; vectored (one syscall per IOV_MAX lines) where supported."""
+    if not hasattr(os, "writev"):
+        view = memoryview(b"".join(bufs))
+        while view:
+            view = view[os.write(fd, view):]
+        return
+    for i in range(0, len(bufs), _IOV_MAX):
+        batch = bufs[i:i + _IOV_MAX]
+        written = os.writev(fd, batch)
+        if written < sum(map(len, batch)):
+            # Short write: finish the rest of this batch with plain writes
+            view = memoryview(b"".join(batch))[written:]
+            while view:
+                view = view[os.write(fd, view):]
+
+
+def _is_same_file(fd: int, path: Path) -> bool:
+    """Whether the open fd still refers to the file at path."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return False
+    fst = os.fstat(fd)
+    return (st.st_ino, st.st_dev) == (fst.st_ino, fst.st_dev)
+
+
+def _encode_entries(entries: List["AuditEntry"]) -> List[bytes]:
+    """JSONL bytes for audit entries: msgspec, else orjson, else the stdlib encoder."""
+    bufs = _encode_entries_fast(entries)
+    # msgspec/orjson write NaN/Infinity as null, so details are only searched
+    # for them when the output has a null
+    if bufs is not None and (
+        not any(b"null" in buf for buf in bufs)
+        or not any(has_non_finite(entry.details) for entry in entries)
+    ):
+        return bufs
+    return [(_encode_line(entry.to_dict()) + "\n").encode("utf-8") for entry in entries]
+
+
+def _encode_entries_fast(entries: List["AuditEntry"]) -> Optional[List[bytes]]:
+    """JSONL bytes from msgspec or orjson; None if neither is installed."""
+    if _encode_lines is not None:
+        try:
+            return [_encode_lines(entries)]
+        except TypeError:
+            pass  # e.g. None/bool keys in details, which orjson's OPT_NON_STR_KEYS accepts
+    if orjson is not None:
+        dumps = orjson.dumps
+        opts = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+        return [dumps(entry.to_dict(), option=opts) for entry in entries]
+    return None
+
+
+def _intern(value: Any) -> Any:
+    # sys.intern only accepts exact str; leave anything else (e.g. str enums) as-is
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class AuditEntry:
     """Represents a single audit log entry."""
     timestamp: str
@@ -20,8 +104,21 @@ class AuditEntry:
     mode: str
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary (``details`` is shared, not deep-copied)."""
+        return {
+            "timestamp": self.timestamp,
+            "action": self.action,
+            "actor": self.actor,
+            "object_type": self.object_type,
+            "object_id": self.object_id,
+            "result": self.result,
+            "details": self.details,
+            "mode": self.mode,
+        }
+
+
+# AuditEntry fields get_entries() can filter on.
+_INDEXED_FIELDS = ("action", "actor", "object_type", "result")
 
 
 class AuditLogger:
@@ -32,18 +129,29 @@ class AuditLogger:
     All audit entries are timestamped and stored in structured format.
     """
     
-    def __init__(self, audit_dir: Path, mode: str = "TEST"):
+    def __init__(self, audit_dir: Path, mode: str = "TEST", capture_tracebacks: bool = True):
         """
         Initialize audit logger.
         
         Args:
             audit_dir: Directory to store audit logs
             mode: Operating mode (TEST, DRY_RUN, LIVE)
+            capture_tracebacks: Whether callers should include formatted
+                tracebacks in error entries (skipping them saves the formatting)
         """
         self.audit_dir = Path(audit_dir)
-        self.audit_dir.mkdir(parents=True, exist_ok=True)
-        self.mode = mode
+        ensure_dir(self.audit_dir)
+        self.mode = _intern(mode)
+        self.capture_tracebacks = capture_tracebacks
         self.entries: List[AuditEntry] = []
+        # Serializes log() so concurrent stages (parallel pipeline groups) index each entry once
+        self._lock = threading.Lock()
+        # field -> value -> positions in self.entries, for get_entries()
+        self._idx: Dict[str, Dict[str, List[int]]] = {f: {} for f in _INDEXED_FIELDS}
+        self._idx_len = 0
+        # filename -> open append fd, and (count, last entry) already written to each file
+        self._fds: Dict[str, int] = {}
+        self._flushed: Dict[str, Tuple[int, Optional[AuditEntry]]] = {}
     
     def log(
         self,
@@ -68,23 +176,42 @@ class AuditLogger:
         Returns:
             Created audit entry
         """
-        timestamp = datetime.now(timezone.utc).isoformat()
+        timestamp = utc_now_iso()
+        # Low-cardinality fields are interned so large runs share one str per value;
+        # object_id is mostly unique and left alone.
         entry = AuditEntry(
             timestamp=timestamp,
-            action=action,
-            actor=actor,
-            object_type=object_type,
+            action=_intern(action),
+            actor=_intern(actor),
+            object_type=_intern(object_type),
             object_id=object_id,
-            result=result,
+            result=_intern(result),
             details=details or {},
             mode=self.mode
         )
-        self.entries.append(entry)
+        with self._lock:
+            self.entries.append(entry)
+            self._index_to(len(self.entries))
         return entry
     
+    def _index_to(self, n: int) -> None:
+        """Index entries up to position n; rebuilds if entries was truncated directly."""
+        if n < self._idx_len:
+            self._idx = {f: {} for f in _INDEXED_FIELDS}
+            self._idx_len = 0
+        for i in range(self._idx_len, n):
+            entry = self.entries[i]
+            for f in _INDEXED_FIELDS:
+                self._idx[f].setdefault(getattr(entry, f), []).append(i)
+        self._idx_len = n
+    
     def save(self, filename: str = "audit.jsonl") -> Path:
         """
-        Save all audit entries to a JSONL file.
+        Save audit entries to a JSONL file.
+        
+        Only entries logged since the previous save() to the same file are
+        appended, so save() can be called periodically during a run. The file
+        stays open until close(), and is reopened if it was rotated or deleted.
         
         Args:
             filename: Name of the audit file
@@ -93,11 +220,51 @@ class AuditLogger:
             Path to saved audit file
         """
         audit_file = self.audit_dir / filename
-        with audit_file.open("a", encoding="utf-8") as f:
-            for entry in self.entries:
-                f.write(json.dumps(entry.to_dict(), ensure_ascii=False) + "\n")
+        entries = self.entries
+        start, last = self._flushed.get(filename, (0, None))
+        if start and (start > len(entries) or entries[start - 1] is not last):
+            # entries was cleared or truncated since the last save: resume after
+            # the last entry written, or write everything if it is gone
+            start = next(
+                (i + 1 for i in range(min(start, len(entries)) - 1, -1, -1) if entries[i] is last),
+                0
+            )
+        pending = entries[start:]
+        
+        fd = self._fds.get(filename)
+        if fd is not None and not _is_same_file(fd, audit_file):
+            # The file was rotated or deleted since the last save: appending to
+            # the old fd would lose these entries, so open the path again
+            del self._fds[filename]
+            os.close(fd)
+            fd = None
+        if fd is None:
+            flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+            fd = self._fds[filename] = with_parent(audit_file, lambda: os.open(audit_file, flags, 0o666))
+        
+        if pending:
+            _write_all(fd, _encode_entries(pending))
+        self._flushed[filename] = (len(entries), entries[-1] if entries else None)
         return audit_file
     
+    def close(self) -> None:
+        """Close the audit files held open by save()."""
+        fds, self._fds = self._fds, {}
+        for fd in fds.values():
+            os.close(fd)
+    
+    def __enter__(self) -> "AuditLogger":
+        return self
+    
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+    
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:
+            pass
+    
     def get_entries(
         self,
         action: Optional[str] = None,
@@ -117,18 +284,39 @@ class AuditLogger:
         Returns:
             List of matching audit entries
         """
-        filtered = self.entries
+        if not (action or actor or object_type or result):
+            return self.entries
+        return list(self.iter_entries(action, actor, object_type, result))
+    
+    def iter_entries(
+        self,
+        action: Optional[str] = None,
+        actor: Optional[str] = None,
+        object_type: Optional[str] = None,
+        result: Optional[str] = None
+    ) -> Iterator[AuditEntry]:
+        """
+        Lazily yield audit entries matching the filters, in log order.
         
-        if action:
-            filtered = [e for e in filtered if e.action == action]
-        if actor:
-            filtered = [e for e in filtered if e.actor == actor]
-        if object_type:
-            filtered = [e for e in filtered if e.object_type == object_type]
-        if result:
-            filtered = [e for e in filtered if e.result == result]
-            
-        return filtered
+        Takes the same filters as get_entries().
+        """
+        filters = [
+            (f, v) for f, v in zip(_INDEXED_FIELDS, (action, actor, object_type, result)) if v
+        ]
+        if not filters:
+            yield from self.entries
+            return
+        
+        with self._lock:
+            self._index_to(len(self.entries))
+        postings = [self._idx[f].get(v, ()) for f, v in filters]
+        # Walk the shortest posting list and check the remaining filters per entry
+        shortest = min(postings, key=len)
+        entries = self.entries
+        for i in shortest:
+            entry = entries[i]
+            if all(getattr(entry, f) == v for f, v in filters):
+                yield entry
     
     @staticmethod
     def load_from_file(audit_file: Path) -> List[Dict[str, Any]]:
@@ -141,10 +329,22 @@ class AuditLogger:
         Returns:
             List of audit entry dictionaries
         """
-        entries = []
-        if audit_file.exists():
-            with audit_file.open("r", encoding="utf-8") as f:
-                for line in f:
-                    if line.strip():
-                        entries.append(json.loads(line))
-        return entries
+        return list(AuditLogger.iter_from_file(audit_file))
+    
+    @staticmethod
+    def iter_from_file(audit_file: Path) -> Iterator[Dict[str, Any]]:
+        """
+        Stream audit entries from a JSONL file one line at a time.
+        
+        Args:
+            audit_file: Path to audit file
+            
+        Yields:
+            Audit entry dictionaries
+        """
+        if not audit_file.exists():
+            return
+        with audit_file.open("rb") as f:
+            for line in f:
+                if line.strip():
+                    yield loads_json(line)
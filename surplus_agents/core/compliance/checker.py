@@ -1,8 +1,11 @@
 """Compliance controls and policy enforcement."""
 
-from typing import Dict, Set, Optional, List, Any
+from typing import Dict, FrozenSet, Optional, List, Any
 from dataclasses import dataclass
 
+# Distinguishes an absent key from one explicitly set to None
+_MISSING = object()
+
 
 @dataclass
 class ComplianceRule:
@@ -29,8 +32,8 @@ class ModeComplianceChecker:
     """
     
     # Actions that are blocked in TEST and DRY_RUN modes
-    RESTRICTED_ACTIONS: Dict[str, Set[str]] = {
-        "TEST": {
+    RESTRICTED_ACTIONS: Dict[str, FrozenSet[str]] = {
+        "TEST": frozenset({
             "send_email",
             "submit_form",
             "place_call",
@@ -39,8 +42,8 @@ class ModeComplianceChecker:
             "make_payment",
             "file_document",
             "send_notification"
-        },
-        "DRY_RUN": {
+        }),
+        "DRY_RUN": frozenset({
             "send_email",
             "submit_form",
             "place_call",
@@ -49,10 +52,12 @@ class ModeComplianceChecker:
             "make_payment",
             "file_document",
             "send_notification"
-        },
-        "LIVE": set()
+        }),
+        "LIVE": frozenset()
     }
     
+    __slots__ = ("mode", "_blocked")
+    
     def __init__(self, mode: str = "TEST"):
         """
         Initialize compliance checker.
@@ -63,6 +68,8 @@ class ModeComplianceChecker:
         if mode not in self.RESTRICTED_ACTIONS:
             raise ValueError(f"Invalid mode: {mode}. Must be TEST, DRY_RUN, or LIVE")
         self.mode = mode
+        # Resolved once; is_action_allowed is called for every agent action.
+        self._blocked = self.RESTRICTED_ACTIONS[mode]
     
     def is_action_allowed(self, action: str) -> bool:
         """
@@ -74,8 +81,7 @@ class ModeComplianceChecker:
         Returns:
             True if allowed, False if blocked
         """
-        blocked = self.RESTRICTED_ACTIONS.get(self.mode, set())
-        return action not in blocked
+        return action not in self._blocked
     
     def assert_action_allowed(self, action: str) -> None:
         """
@@ -146,7 +152,8 @@ class RequiredFieldRule(ComplianceRule):
         if not isinstance(data, dict):
             return "Data must be a dictionary"
         
-        missing = [f for f in self.fields if f not in data or not data[f]]
+        # One lookup per field: an absent key reads as None, which is falsy anyway
+        missing = [f for f in self.fields if not data.get(f)]
         if missing:
             return f"Missing required fields: {', '.join(missing)}"
         return None
@@ -169,9 +176,10 @@ class DataFormatRule(ComplianceRule):
         if not isinstance(data, dict):
             return "Data must be a dictionary"
         
-        if self.field not in data:
+        value = data.get(self.field, _MISSING)
+        if value is _MISSING:
             return None  # Field not present, skip validation
         
-        if not self.validator_func(data[self.field]):
+        if not self.validator_func(value):
             return f"{self.field}: {self.error_message}"
         return None
@@ -13,10 +13,10 @@ class Config:
     """
     
     # Valid operating modes
-    VALID_MODES = {"TEST", "DRY_RUN", "LIVE"}
+    VALID_MODES = frozenset({"TEST", "DRY_RUN", "LIVE"})
     
     # Valid network settings
-    VALID_NETWORK = {"ON", "OFF"}
+    VALID_NETWORK = frozenset({"ON", "OFF"})
     
     def __init__(
         self,
@@ -35,10 +35,10 @@ class Config:
             audit_dir: Directory for audit logs
         """
         if mode not in self.VALID_MODES:
-            raise ValueError(f"Invalid mode: {mode}. Must be one of {self.VALID_MODES}")
+            raise ValueError(f"Invalid mode: {mode}. Must be one of {', '.join(sorted(self.VALID_MODES))}")
         
         if network not in self.VALID_NETWORK:
-            raise ValueError(f"Invalid network: {network}. Must be one of {self.VALID_NETWORK}")
+            raise ValueError(f"Invalid network: {network}. Must be one of {', '.join(sorted(self.VALID_NETWORK))}")
         
         self.mode = mode
         self.network = network
@@ -1,12 +1,36 @@
 """Logging utilities for Surplus Autonomy Agents."""
 
+import atexit
 import logging
+import os
+import queue
 import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 from datetime import datetime
 
 
+class _CachedTimeFormatter(logging.Formatter):
+    """Formatter that runs strftime for asctime at most once per second."""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (second, formatted) as one tuple so concurrent handlers never see a torn pair
+        self._last = (-1, "")
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        if not datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        last_second, formatted = self._last
+        if second != last_second:
+            formatted = time.strftime(datefmt, self.converter(second))
+            self._last = (second, formatted)
+        return formatted
+
+
 def setup_logger(
     name: str,
     log_file: Optional[Path] = None,
@@ -22,6 +46,10 @@ def setup_logger(
         level: Logging level
         mode: Operating mode (added to log records)
         
+    Set SURPLUS_LOG_QUEUE=1 to write the log file from a background thread:
+    records are queued and a QueueListener owns the FileHandler, so callers
+    do not block on file I/O.
+        
     Returns:
         Configured logger instance
     """
@@ -37,7 +65,7 @@ def setup_logger(
     console_handler.setLevel(level)
     
     # Format with mode
-    formatter = logging.Formatter(
+    formatter = _CachedTimeFormatter(
         f'[%(asctime)s] [%(name)s] [{mode}] [%(levelname)s] %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
@@ -50,6 +78,18 @@ def setup_logger(
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        if os.getenv("SURPLUS_LOG_QUEUE") == "1":
+            log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+            queue_handler = QueueHandler(log_queue)
+            queue_handler.setLevel(level)
+            logger.addHandler(queue_handler)
+            listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            # Where Python 3.12's dictConfig keeps it, so callers can stop it early
+            queue_handler.listener = listener
+            listener.start()
+            # Drains pending records before the interpreter exits
+            atexit.register(listener.stop)
+        else:
+            logger.addHandler(file_handler)
     
     return logger
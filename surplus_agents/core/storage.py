@@ -1,8 +1,252 @@
 """Storage utilities for Surplus Autonomy Agents."""
 
+import hashlib
 import json
+import math
+import os
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Set, TypeVar
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None
+
+_T = TypeVar("_T")
+
+# Directories already created (or confirmed) in this process.
+_DIR_CACHE: Set[str] = set()
+
+
+def has_non_finite(data: Any) -> bool:
+    """
+    Check for NaN/Infinity floats, which JSON encoders disagree on.
+    
+    Args:
+        data: Value to check (dicts, lists and tuples are searched)
+        
+    Returns:
+        True if a non-finite float occurs in data
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return True
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return False
+
+
+def dumps_json(data: Any) -> bytes:
+    """
+    Serialize data as indented UTF-8 JSON (the StorageManager.save_json format).
+    
+    Uses orjson when installed, the stdlib otherwise.
+    
+    Args:
+        data: Data to serialize
+        
+    Returns:
+        Encoded JSON
+    """
+    if orjson is not None:
+        try:
+            buf = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            pass  # e.g. ints beyond 64 bits; let the stdlib encode it or raise
+        else:
+            # orjson writes NaN/Infinity as null; the stdlib keeps them (as json.dumps
+            # always has). Only output with a null can have had one, so only it is searched.
+            if b"null" not in buf or not has_non_finite(data):
+                return buf
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def loads_json(buf: bytes) -> Any:
+    """
+    Parse JSON bytes.
+    
+    Uses orjson when installed, the stdlib for what orjson rejects (NaN/Infinity).
+    
+    Args:
+        buf: Encoded JSON
+        
+    Returns:
+        Decoded data
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(buf)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(buf)
+
+
+def write_file(path: Path, data: bytes, flags: int = os.O_TRUNC) -> None:
+    """
+    Write bytes with raw os.open/os.write (no BufferedWriter per call).
+    
+    Args:
+        path: File path
+        data: Content to write
+        flags: os.O_TRUNC to replace the file, os.O_APPEND to append
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | flags | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def ensure_dir(path: Path) -> None:
+    """
+    Create a directory tree.
+    
+    A directory seen before costs one mkdir (no walk over its parents); if it
+    or a parent was removed since, the whole tree is created again.
+    
+    Args:
+        path: Directory path
+    """
+    key = str(path)
+    if key in _DIR_CACHE:
+        try:
+            path.mkdir(exist_ok=True)
+            return
+        except FileNotFoundError:
+            pass  # a parent was removed since it was cached; recreate below
+    path.mkdir(parents=True, exist_ok=True)
+    _DIR_CACHE.add(key)
+
+
+def with_parent(path: Path, write: Callable[[], _T]) -> _T:
+    """
+    Run a write into path's directory, creating the directory first.
+    
+    If the directory is removed before write() runs, it is recreated and
+    write() is retried once.
+    
+    Args:
+        path: File the write creates
+        write: Performs the write
+        
+    Returns:
+        write()'s return value
+    """
+    ensure_dir(path.parent)
+    try:
+        return write()
+    except FileNotFoundError:
+        ensure_dir(path.parent)
+        return write()
+
+
+class ArtifactPack:
+    """
+    Append-only pack of many small artifacts in a single file.
+    
+    Artifacts are appended to ``pack.bin`` and addressed through
+    ``pack.index.json`` (name -> offset, length, sha256), so a run that
+    emits hundreds of small artifacts creates two files instead of hundreds.
+    Re-adding a name points the index at the newer bytes.
+    """
+    
+    DATA_FILE = "pack.bin"
+    INDEX_FILE = "pack.index.json"
+    
+    def __init__(self, directory: Path):
+        """
+        Open (or create) a pack in a directory.
+        
+        Args:
+            directory: Directory holding the pack files
+        """
+        self.directory = Path(directory)
+        self.data_path = self.directory / self.DATA_FILE
+        self.index_path = self.directory / self.INDEX_FILE
+        self.index: Dict[str, Dict[str, Any]] = (
+            loads_json(self.index_path.read_bytes())
+            if self.index_path.exists() else {}
+        )
+        self._file: Optional[Any] = with_parent(self.data_path, lambda: self.data_path.open('ab'))
+        self._offset = self._file.tell()
+    
+    def add_bytes(self, name: str, data: bytes) -> Dict[str, Any]:
+        """
+        Append raw bytes under a name.
+        
+        Args:
+            name: Artifact name within the pack
+            data: Artifact content
+            
+        Returns:
+            Index entry with offset, length and sha256
+        """
+        if self._file is None:
+            raise ValueError("ArtifactPack is closed")
+        self._file.write(data)
+        entry = {
+            "offset": self._offset,
+            "length": len(data),
+            "sha256": hashlib.sha256(data).hexdigest()
+        }
+        self._offset += len(data)
+        self.index[name] = entry
+        return entry
+    
+    def add_json(self, name: str, data: Any) -> Dict[str, Any]:
+        """Append data serialized as JSON (same format as StorageManager.save_json)."""
+        return self.add_bytes(name, dumps_json(data))
+    
+    def add_text(self, name: str, text: str) -> Dict[str, Any]:
+        """Append UTF-8 text."""
+        return self.add_bytes(name, text.encode('utf-8'))
+    
+    def read(self, name: str) -> bytes:
+        """
+        Read an artifact back from the pack.
+        
+        Args:
+            name: Artifact name within the pack
+            
+        Returns:
+            Artifact content
+        """
+        if self._file is not None:
+            self._file.flush()
+        return _read_pack_entry(self.data_path, self.index[name])
+    
+    def close(self) -> None:
+        """Flush the data file and write the index."""
+        if self._file is None:
+            return
+        self._file.close()
+        self._file = None
+        self.index_path.write_bytes(dumps_json(self.index))
+    
+    def __enter__(self) -> "ArtifactPack":
+        return self
+    
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def _read_pack_entry(data_path: Path, entry: Dict[str, Any]) -> bytes:
+    """Positional read of one pack entry."""
+    fd = os.open(data_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if hasattr(os, "pread"):
+            return os.pread(fd, entry["length"], entry["offset"])
+        os.lseek(fd, entry["offset"], os.SEEK_SET)
+        return os.read(fd, entry["length"])
+    finally:
+        os.close(fd)
 
 
 class StorageManager:
@@ -21,7 +265,7 @@ class StorageManager:
             base_dir: Base directory for all storage
         """
         self.base_dir = Path(base_dir)
-        self.base_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(self.base_dir)
     
     def get_agent_dir(self, agent_name: str, run_id: str) -> Path:
         """
@@ -35,7 +279,7 @@ class StorageManager:
             Path to agent's run directory
         """
         agent_dir = self.base_dir / agent_name / run_id
-        agent_dir.mkdir(parents=True, exist_ok=True)
+        ensure_dir(agent_dir)
         return agent_dir
     
     def save_json(self, path: Path, data: Any) -> Path:
@@ -49,9 +293,8 @@ class StorageManager:
         Returns:
             Path to saved file
         """
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open('w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        buf = dumps_json(data)
+        with_parent(path, lambda: write_file(path, buf))
         return path
     
     def load_json(self, path: Path) -> Any:
@@ -64,8 +307,7 @@ class StorageManager:
         Returns:
             Loaded data
         """
-        with path.open('r', encoding='utf-8') as f:
-            return json.load(f)
+        return loads_json(path.read_bytes())
     
     def save_text(self, path: Path, text: str) -> Path:
         """
@@ -78,8 +320,8 @@ class StorageManager:
         Returns:
             Path to saved file
         """
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(text, encoding='utf-8')
+        buf = text.encode('utf-8')
+        with_parent(path, lambda: write_file(path, buf))
         return path
     
     def load_text(self, path: Path) -> str:
@@ -109,3 +351,51 @@ class StorageManager:
             return []
         
         return [d.name for d in agent_dir.iterdir() if d.is_dir()]
+    
+    def compute_hash(self, path: Path) -> str:
+        """
+        Compute the SHA-256 of a file.
+        
+        Args:
+            path: File path
+            
+        Returns:
+            Hex digest
+        """
+        with path.open('rb') as f:
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(f, 'sha256').hexdigest()
+            h = hashlib.sha256()
+            buf = memoryview(bytearray(1024 * 1024))
+            while n := f.readinto(buf):
+                h.update(buf[:n])
+        return h.hexdigest()
+    
+    def open_pack(self, agent_name: str, run_id: str) -> ArtifactPack:
+        """
+        Open an artifact pack in an agent run directory.
+        
+        Args:
+            agent_name: Name of the agent
+            run_id: Run identifier
+            
+        Returns:
+            ArtifactPack (use as a context manager, or call close())
+        """
+        return ArtifactPack(self.get_agent_dir(agent_name, run_id))
+    
+    def read_from_pack(self, agent_name: str, run_id: str, name: str) -> bytes:
+        """
+        Read one artifact from a closed pack.
+        
+        Args:
+            agent_name: Name of the agent
+            run_id: Run identifier
+            name: Artifact name within the pack
+            
+        Returns:
+            Artifact content
+        """
+        pack_dir = self.base_dir / agent_name / run_id
+        index = loads_json((pack_dir / ArtifactPack.INDEX_FILE).read_bytes())
+        return _read_pack_entry(pack_dir / ArtifactPack.DATA_FILE, index[name])
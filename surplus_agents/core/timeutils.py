@@ -1 +1,26 @@
 """Time utilities for Surplus Autonomy Agents."""
+
+import time
+from typing import Tuple
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") for the last second formatted
+_iso_second: Tuple[int, str] = (-1, "")
+
+
+def utc_now_iso() -> str:
+    """
+    Current UTC time as ISO-8601 with microseconds.
+    
+    Same form as ``datetime.now(timezone.utc).isoformat()`` (always with the
+    microsecond field), but the date/time part is formatted once per second.
+    
+    Returns:
+        Timestamp such as ``2024-01-01T00:00:00.000000+00:00``
+    """
+    global _iso_second
+    sec, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_sec, prefix = _iso_second
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _iso_second = (sec, prefix)
+    return f"{prefix}.{ns // 1000:06d}+00:00"
@@ -3,7 +3,8 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 import time
-from datetime import datetime, timezone
+
+from ...core.timeutils import utc_now_iso
 
 
 class BaseScraper(ABC):
@@ -31,15 +32,19 @@ class BaseScraper(ABC):
         self.mode = mode
         self.rate_limit_seconds = rate_limit_seconds
         self.max_retries = max_retries
-        self.last_request_time = 0.0
+        self._next_allowed = float("-inf")  # monotonic time of the next permitted request
     
     def _rate_limit(self) -> None:
         """Enforce rate limiting between requests."""
-        if self.rate_limit_seconds > 0:
-            elapsed = time.time() - self.last_request_time
-            if elapsed < self.rate_limit_seconds:
-                time.sleep(self.rate_limit_seconds - elapsed)
-        self.last_request_time = time.time()
+        if self.rate_limit_seconds <= 0:
+            return
+        # Monotonic clock: a wall-clock step (NTP) cannot stretch or skip the wait
+        now = time.monotonic()
+        if now < self._next_allowed:
+            time.sleep(self._next_allowed - now)
+            # Schedule from the slot, not the wake-up, so sleep overshoot doesn't accumulate
+            now = self._next_allowed
+        self._next_allowed = now + self.rate_limit_seconds
     
     @abstractmethod
     def scrape(self, url: str, **kwargs) -> Dict[str, Any]:
@@ -80,7 +85,7 @@ class BaseScraper(ABC):
             "data": data,
             "error": error,
             "metadata": {
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": utc_now_iso(),
                 "mode": self.mode,
                 "scraper": self.__class__.__name__
             }
@@ -6,6 +6,13 @@ try:
 except ImportError:
     BeautifulSoup = None
 
+# lxml's C parser when installed; the pure-Python html.parser otherwise
+try:
+    import lxml  # noqa: F401
+    _DEFAULT_PARSER = "lxml"
+except ImportError:
+    _DEFAULT_PARSER = "html.parser"
+
 from .base import BaseScraper
 
 
@@ -46,6 +53,7 @@ class CountyWebsiteScraper(BaseScraper):
             **kwargs: Additional options:
                 - fixture_key: Fixture file to use in TEST mode
                 - selectors: CSS selectors for data extraction
+                - parser: HTML parser to use (default: "lxml" if installed, else "html.parser")
                 
         Returns:
             Dictionary containing scraped data
@@ -68,7 +76,7 @@ class CountyWebsiteScraper(BaseScraper):
                     raise RuntimeError("No HTTP client available for scraping")
             
             # Parse HTML
-            parser = kwargs.get('parser', 'html.parser')
+            parser = kwargs.get('parser', _DEFAULT_PARSER)
             soup = BeautifulSoup(html, parser)
             
             # Extract data using selectors
@@ -104,13 +112,21 @@ class CountyWebsiteScraper(BaseScraper):
         
         # Default extraction if no selectors provided
         if not selectors:
+            # One document walk collects headings and links, in document order
+            headings = []
+            links = []
+            for el in soup.find_all(['h1', 'h2', 'h3', 'a']):
+                if el.name != 'a':
+                    headings.append(el.get_text(strip=True))
+                else:
+                    href = el.get('href')
+                    if href is not None:
+                        links.append({'text': el.get_text(strip=True), 'href': href})
+            title = soup.title
             extracted = {
-                'title': soup.title.get_text(strip=True) if soup.title else None,
-                'headings': [h.get_text(strip=True) for h in soup.find_all(['h1', 'h2', 'h3'])],
-                'links': [
-                    {'text': a.get_text(strip=True), 'href': a.get('href')}
-                    for a in soup.find_all('a', href=True)
-                ]
+                'title': title.get_text(strip=True) if title else None,
+                'headings': headings,
+                'links': links
             }
         
         return extracted
@@ -1,14 +1,105 @@
 """HTML extractor for parsing and extracting data from HTML documents."""
 
-from pathlib import Path
-from typing import Any, Dict, Optional
+import os
+import re
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
 try:
     from bs4 import BeautifulSoup
 except ImportError:
     BeautifulSoup = None
 
+# lxml's C parser when installed; the pure-Python html.parser otherwise
+try:
+    from lxml import etree, html as lxml_html
+    _DEFAULT_PARSER = "lxml"
+except ImportError:
+    etree = lxml_html = None
+    _DEFAULT_PARSER = "html.parser"
+
+# CSS -> XPath translation for the lxml selector path
+try:
+    from cssselect import HTMLTranslator, SelectorError
+except ImportError:
+    HTMLTranslator = SelectorError = None
+
 from .base import BaseExtractor
 
+# Elements whose text (at any depth) BeautifulSoup's get_text() leaves out:
+# bs4 stores it as Script/Stylesheet/TemplateString/Ruby*String, not NavigableString
+_NON_TEXT_TAGS = ("script", "style", "template", "rt", "rp")
+
+# Sources starting with markup are HTML, not paths; match() only scans the prefix
+_MARKUP_START = re.compile(r"\s*<")
+_MARKUP_START_BYTES = re.compile(rb"\s*<")
+
+# Attribute-value selectors ([type=text], [href^=...]); soupsieve compares some
+# values (e.g. type) case-insensitively in HTML and cssselect does not
+_ATTR_VALUE_SELECTOR = re.compile(r"\[[^\]]*=")
+
+
+def _is_existing_path(source: Any) -> bool:
+    # Large HTML strings are not paths; stat() on them fails with ENAMETOOLONG.
+    # os.path rather than Path(): no parse of the whole string, and bytes work
+    try:
+        return os.path.exists(source)
+    except (OSError, ValueError):
+        return False
+
+
+def _load_html(source: Any, is_file: bool = False) -> Any:
+    """Return the HTML in source, reading it first if source names a file."""
+    if not is_file:
+        # Markup is never a path; skip the stat() (and its copy of the string)
+        if isinstance(source, str):
+            if _MARKUP_START.match(source):
+                return source
+        elif isinstance(source, bytes):
+            if _MARKUP_START_BYTES.match(source):
+                return source
+        else:
+            return source
+        if not _is_existing_path(source):
+            return source
+    with open(source, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+@lru_cache(maxsize=256)
+def _compiled_xpath(selector: str) -> Any:
+    """CSS selector compiled to an lxml XPath, reused across documents."""
+    return etree.XPath(HTMLTranslator().css_to_xpath(selector))
+
+
+def _lxml_text(el: Any, check_ancestors: bool = True) -> str:
+    """
+    lxml equivalent of bs4's get_text(strip=True).
+    
+    check_ancestors=False skips the walk up the tree for script/style/...
+    ancestors, for callers that already know el has none.
+    """
+    if check_ancestors and next(el.iterancestors(*_NON_TEXT_TAGS), None) is not None:
+        return ""
+    if not len(el) and el.tag not in _NON_TEXT_TAGS:
+        # Leaf element (most table cells): its own text is the whole result
+        text = el.text
+        return text.strip() if text else ""
+    parts: List[str] = []
+    
+    def walk(node: Any) -> None:
+        # Comments/PIs have a non-str tag; their text is skipped, their tail is not
+        if not isinstance(node.tag, str) or node.tag in _NON_TEXT_TAGS:
+            return
+        if node.text:
+            parts.append(node.text)
+        for child in node:
+            walk(child)
+            if child.tail:
+                parts.append(child.tail)
+    
+    walk(el)
+    return "".join(p for p in (s.strip() for s in parts) if p)
+
 
 class HTMLExtractor(BaseExtractor):
     """
@@ -37,44 +128,48 @@ class HTMLExtractor(BaseExtractor):
             source: HTML string or file path
             **kwargs: Additional options:
                 - selectors: Dict mapping field names to CSS selectors
-                - parser: HTML parser to use (default: "html.parser")
+                - parser: HTML parser to use (default: "lxml" if installed, else "html.parser")
                 - is_file: If True, treat source as file path; if False, treat as HTML string
+                - include_text: If False, omit the full page 'text' from the default
+                  (no selectors) output, skipping a walk over every text node (default: True)
+                - soup: Already-parsed BeautifulSoup document to extract from instead
+                  of parsing source (source is then ignored)
                 
         Returns:
             Dictionary containing extracted data
         """
-        # Determine if source is a file path or string
-        is_file = kwargs.get('is_file', False)
-        
-        if is_file or (isinstance(source, (str, bytes)) and Path(source).exists()):
-            # It's a file path
-            with open(source, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-        else:
-            html_content = source
-        
-        parser = kwargs.get('parser', 'html.parser')
-        soup = BeautifulSoup(html_content, parser)
-        
         selectors = kwargs.get('selectors', {})
-        extracted = {}
+        extracted = None
+        soup = kwargs.get('soup')
+        if soup is not None:
+            parser = soup.builder.NAME
+        else:
+            html_content = _load_html(source, kwargs.get('is_file', False))
+            parser = kwargs.get('parser', _DEFAULT_PARSER)
+            if (selectors and parser == "lxml" and lxml_html is not None
+                    and HTMLTranslator is not None and isinstance(html_content, str)):
+                extracted = self._select_lxml(html_content, selectors)
+            if extracted is None:
+                soup = BeautifulSoup(html_content, parser)
         
-        # Extract data using provided selectors
-        for field_name, selector in selectors.items():
-            element = soup.select_one(selector)
-            extracted[field_name] = element.get_text(strip=True) if element else None
-        
-        # If no selectors provided, extract basic metadata
-        if not selectors:
-            extracted = {
-                'title': soup.title.get_text(strip=True) if soup.title else None,
-                'text': soup.get_text(separator=' ', strip=True),
-                'links': [a.get('href') for a in soup.find_all('a', href=True)],
-                'meta_tags': {
+        if extracted is None:
+            extracted = {}
+            
+            # Extract data using provided selectors
+            for field_name, selector in selectors.items():
+                element = soup.select_one(selector)
+                extracted[field_name] = element.get_text(strip=True) if element else None
+            
+            # If no selectors provided, extract basic metadata
+            if not selectors:
+                extracted = {'title': soup.title.get_text(strip=True) if soup.title else None}
+                if kwargs.get('include_text', True):
+                    extracted['text'] = soup.get_text(separator=' ', strip=True)
+                extracted['links'] = [a.get('href') for a in soup.find_all('a', href=True)]
+                extracted['meta_tags'] = {
                     meta.get('name', meta.get('property', '')): meta.get('content', '')
                     for meta in soup.find_all('meta') if meta.get('content')
                 }
-            }
         
         return {
             'source_type': 'html',
@@ -85,6 +180,36 @@ class HTMLExtractor(BaseExtractor):
             }
         }
     
+    @staticmethod
+    def _select_lxml(html_content: str, selectors: Dict[str, str]) -> Optional[Dict[str, Any]]:
+        """
+        Selector extraction on lxml nodes, with each CSS selector compiled to XPath once.
+        
+        Same libxml2 parse as BeautifulSoup's lxml builder, and XPath results
+        come back in document order like select_one(). Returns None if lxml
+        rejects the input or cssselect cannot translate a selector (e.g. a
+        soupsieve-only pseudo-class), or if a selector matches on attribute
+        values, so the caller falls back to BeautifulSoup.
+        """
+        if any(_ATTR_VALUE_SELECTOR.search(selector) for selector in selectors.values()):
+            return None
+        try:
+            root = lxml_html.document_fromstring(html_content)
+        except etree.ParserError:
+            return {field_name: None for field_name in selectors}  # empty document
+        except ValueError:
+            return None
+        tree = root.getroottree()
+        
+        extracted = {}
+        for field_name, selector in selectors.items():
+            try:
+                matches = _compiled_xpath(selector)(tree)
+            except SelectorError:
+                return None
+            extracted[field_name] = _lxml_text(matches[0]) if matches else None
+        return extracted
+    
     def extract_table(self, source: Any, table_selector: Optional[str] = None, **kwargs) -> Dict[str, Any]:
         """
         Extract table data from HTML.
@@ -94,20 +219,18 @@ class HTMLExtractor(BaseExtractor):
             table_selector: CSS selector for the table (default: first table)
             **kwargs: Additional options:
                 - is_file: If True, treat source as file path
-                - parser: HTML parser to use (default: "html.parser")
+                - parser: HTML parser to use (default: "lxml" if installed, else "html.parser")
             
         Returns:
             Dictionary with table data as list of rows
         """
-        is_file = kwargs.get('is_file', False)
-        
-        if is_file or (isinstance(source, (str, bytes)) and Path(source).exists()):
-            with open(source, 'r', encoding='utf-8') as f:
-                html_content = f.read()
-        else:
-            html_content = source
+        html_content = _load_html(source, kwargs.get('is_file', False))
         
-        parser = kwargs.get('parser', 'html.parser')
+        parser = kwargs.get('parser', _DEFAULT_PARSER)
+        if parser == "lxml" and lxml_html is not None and not table_selector and isinstance(html_content, str):
+            result = self._extract_table_lxml(html_content)
+            if result is not None:
+                return result
         soup = BeautifulSoup(html_content, parser)
         
         if table_selector:
@@ -139,3 +262,52 @@ class HTMLExtractor(BaseExtractor):
             'rows': rows,
             'row_count': len(rows)
         }
+    
+    @staticmethod
+    def _extract_table_lxml(html_content: str) -> Optional[Dict[str, Any]]:
+        """
+        extract_table on lxml nodes directly, without building a BeautifulSoup tree.
+        
+        Same libxml2 parse and same traversal as the BeautifulSoup path, so the
+        output is identical; used for the default (first table, lxml) case.
+        Returns None if lxml rejects the input (e.g. a str with an XML
+        encoding declaration) so the caller can fall back to BeautifulSoup.
+        """
+        try:
+            root = lxml_html.document_fromstring(html_content)
+        except etree.ParserError:
+            return {'rows': [], 'headers': []}  # empty document
+        except ValueError:
+            return None
+        table = next(root.iter('table'), None)
+        
+        if table is None:
+            return {'rows': [], 'headers': []}
+        
+        # Cells only need their own ancestor check if a non-text element
+        # encloses the table or sits somewhere inside it
+        check = (next(table.iterancestors(*_NON_TEXT_TAGS), None) is not None
+                 or next(table.iter(*_NON_TEXT_TAGS), None) is not None)
+        
+        # Extract headers
+        headers = []
+        header_row = next(table.iter('thead'), None)
+        if header_row is not None:
+            headers = [_lxml_text(cell, check) for cell in header_row.iter('th', 'td')]
+        
+        # Extract data rows
+        rows = []
+        tbody = next(table.iter('tbody'), None)
+        if tbody is None:
+            tbody = table
+        for tr in tbody.iter('tr'):
+            cells = list(tr.iter('td', 'th'))
+            if cells:
+                rows.append([_lxml_text(cell, check) for cell in cells])
+        
+        return {
+            'source_type': 'html_table',
+            'headers': headers,
+            'rows': rows,
+            'row_count': len(rows)
+        }
@@ -2,9 +2,96 @@
 
 from typing import Any, Dict, List, Optional
 from datetime import datetime
+from types import MappingProxyType
 import re
 
 
+# Compiled once; the normalize_* methods run per field of every record
+_NON_DIGIT_RE = re.compile(r'\D')
+# ASCII non-digits, for bytes.translate's delete argument (one C pass, no regex)
+_ASCII_NON_DIGITS = bytes(c for c in range(128) if not 48 <= c <= 57)
+_ZIP_CLEAN_RE = re.compile(r'[^\d-]')
+# Already-normalized ZIP/ZIP+4: returned as-is by _normalize_zip
+_ZIP_RE = re.compile(r'\d{5}(?:-\d{4})?')
+
+# Numeric date shapes, with the same field patterns datetime.strptime uses for
+# %Y, %m and %d, so a fast-path match parses exactly like the strptime formats
+_Y = r'(\d\d\d\d)'
+_M = r'(1[0-2]|0[1-9]|[1-9])'
+_D = r'(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])'
+# (pattern, year group, month group, day group), in normalize_date's format order
+_NUMERIC_DATE_FORMATS = (
+    (re.compile(f'{_Y}-{_M}-{_D}'), 1, 2, 3),  # %Y-%m-%d
+    (re.compile(f'{_M}/{_D}/{_Y}'), 3, 1, 2),  # %m/%d/%Y
+    (re.compile(f'{_M}-{_D}-{_Y}'), 3, 1, 2),  # %m-%d-%Y
+    (re.compile(f'{_D}/{_M}/{_Y}'), 3, 2, 1),  # %d/%m/%Y
+)
+# Tried with strptime after the numeric shapes, in this order
+_NAMED_MONTH_FORMATS = ("%B %d, %Y", "%b %d, %Y")
+
+# US state/territory names -> USPS abbreviations
+_STATE_NAMES = {
+    'ALABAMA': 'AL',
+    'ALASKA': 'AK',
+    'ARIZONA': 'AZ',
+    'ARKANSAS': 'AR',
+    'CALIFORNIA': 'CA',
+    'COLORADO': 'CO',
+    'CONNECTICUT': 'CT',
+    'DELAWARE': 'DE',
+    'FLORIDA': 'FL',
+    'GEORGIA': 'GA',
+    'HAWAII': 'HI',
+    'IDAHO': 'ID',
+    'ILLINOIS': 'IL',
+    'INDIANA': 'IN',
+    'IOWA': 'IA',
+    'KANSAS': 'KS',
+    'KENTUCKY': 'KY',
+    'LOUISIANA': 'LA',
+    'MAINE': 'ME',
+    'MARYLAND': 'MD',
+    'MASSACHUSETTS': 'MA',
+    'MICHIGAN': 'MI',
+    'MINNESOTA': 'MN',
+    'MISSISSIPPI': 'MS',
+    'MISSOURI': 'MO',
+    'MONTANA': 'MT',
+    'NEBRASKA': 'NE',
+    'NEVADA': 'NV',
+    'NEW HAMPSHIRE': 'NH',
+    'NEW JERSEY': 'NJ',
+    'NEW MEXICO': 'NM',
+    'NEW YORK': 'NY',
+    'NORTH CAROLINA': 'NC',
+    'NORTH DAKOTA': 'ND',
+    'OHIO': 'OH',
+    'OKLAHOMA': 'OK',
+    'OREGON': 'OR',
+    'PENNSYLVANIA': 'PA',
+    'RHODE ISLAND': 'RI',
+    'SOUTH CAROLINA': 'SC',
+    'SOUTH DAKOTA': 'SD',
+    'TENNESSEE': 'TN',
+    'TEXAS': 'TX',
+    'UTAH': 'UT',
+    'VERMONT': 'VT',
+    'VIRGINIA': 'VA',
+    'WASHINGTON': 'WA',
+    'WEST VIRGINIA': 'WV',
+    'WISCONSIN': 'WI',
+    'WYOMING': 'WY',
+    'DISTRICT OF COLUMBIA': 'DC',
+    'PUERTO RICO': 'PR',
+    'GUAM': 'GU',
+    'U.S. VIRGIN ISLANDS': 'VI',
+    'AMERICAN SAMOA': 'AS',
+    'NORTHERN MARIANA ISLANDS': 'MP',
+}
+# Names and abbreviations both resolve with one lookup
+_STATE_MAP = MappingProxyType({**_STATE_NAMES, **{a: a for a in _STATE_NAMES.values()}})
+
+
 class DataNormalizer:
     """
     Normalizes and standardizes extracted data.
@@ -29,11 +116,9 @@ class DataNormalizer:
         if not text:
             return ""
         
-        # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
-        # Trim
-        text = text.strip()
-        return text
+        # Collapse whitespace runs and trim; str.split() uses the same
+        # whitespace definition as the regex \s
+        return ' '.join(text.split())
     
     def normalize_phone(self, phone: str) -> Optional[str]:
         """
@@ -48,8 +133,11 @@ class DataNormalizer:
         if not phone:
             return None
         
-        # Extract digits only
-        digits = re.sub(r'\D', '', phone)
+        # Extract digits only; the regex handles non-ASCII (Unicode) digits
+        if phone.isascii():
+            digits = phone.encode('ascii').translate(None, _ASCII_NON_DIGITS).decode('ascii')
+        else:
+            digits = _NON_DIGIT_RE.sub('', phone)
         
         # Handle US phone numbers
         if len(digits) == 10:
@@ -93,20 +181,12 @@ class DataNormalizer:
     
     def _normalize_state(self, state: str) -> str:
         """Normalize US state code."""
-        # Map common state names to abbreviations
-        state_map = {
-            'CALIFORNIA': 'CA',
-            'TEXAS': 'TX',
-            'FLORIDA': 'FL',
-            'NEW YORK': 'NY',
-            # Add more as needed
-        }
-        
         state_upper = state.upper()
-        if state_upper in state_map:
-            return state_map[state_upper]
+        abbrev = _STATE_MAP.get(state_upper)
+        if abbrev is not None:
+            return abbrev
         
-        # If already 2 letters, assume it's an abbreviation
+        # Any other 2 letters: assume it's an abbreviation
         if len(state_upper) == 2:
             return state_upper
         
@@ -114,8 +194,12 @@ class DataNormalizer:
     
     def _normalize_zip(self, zip_code: str) -> str:
         """Normalize ZIP code."""
+        # Common case: one fullmatch instead of sub + scan + split
+        if _ZIP_RE.fullmatch(zip_code):
+            return zip_code
+        
         # Extract digits and hyphen
-        cleaned = re.sub(r'[^\d-]', '', zip_code)
+        cleaned = _ZIP_CLEAN_RE.sub('', zip_code)
         
         # Format as XXXXX or XXXXX-XXXX
         if '-' in cleaned:
@@ -143,25 +227,40 @@ class DataNormalizer:
         if not date_str:
             return None
         
-        # Common date formats to try
-        formats = [
-            "%Y-%m-%d",
-            "%m/%d/%Y",
-            "%m-%d-%Y",
-            "%d/%m/%Y",
-            "%B %d, %Y",
-            "%b %d, %Y",
-        ]
-        
-        for fmt in formats:
+        date_str = date_str.strip()
+        dt = self._parse_numeric_date(date_str)
+        if dt is not None:
+            if output_format == "%Y-%m-%d" and dt.year >= 1000:
+                return f"{dt.year}-{dt.month:02d}-{dt.day:02d}"
+            return dt.strftime(output_format)
+        
+        # Month-name formats; the numeric ones were covered by the fast path
+        for fmt in _NAMED_MONTH_FORMATS:
             try:
-                dt = datetime.strptime(date_str.strip(), fmt)
+                dt = datetime.strptime(date_str, fmt)
                 return dt.strftime(output_format)
             except ValueError:
                 continue
         
         return None
     
+    @staticmethod
+    def _parse_numeric_date(date_str: str) -> Optional[datetime]:
+        """
+        Regex fast path for the numeric formats tried by normalize_date.
+        
+        Returns the date the first matching strptime format would produce,
+        or None if none of the numeric formats parse.
+        """
+        for pattern, y, m, d in _NUMERIC_DATE_FORMATS:
+            match = pattern.fullmatch(date_str)
+            if match:
+                try:
+                    return datetime(int(match[y]), int(match[m]), int(match[d]))
+                except ValueError:
+                    continue
+        return None
+    
     def normalize_currency(self, amount: Any) -> Optional[float]:
         """
         Normalize currency amount to float.
@@ -178,8 +277,8 @@ class DataNormalizer:
         if isinstance(amount, (int, float)):
             return float(amount)
         
-        # Remove currency symbols and commas
-        cleaned = re.sub(r'[$,]', '', str(amount))
+        # Remove currency symbols and commas (two str.replace calls beat a regex sub)
+        cleaned = str(amount).replace('$', '').replace(',', '')
         
         try:
             return float(cleaned)
@@ -1,11 +1,20 @@
 """PDF extractor for parsing and extracting data from PDF documents."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional, List
 import re
 
 from .base import BaseExtractor
 
+_FIELD_FLAGS = re.IGNORECASE | re.MULTILINE
+
+
+@lru_cache(maxsize=1024)
+def _compile(pattern: str, flags: int) -> "re.Pattern[str]":
+    # Own cache so large field-pattern sets don't churn re's internal cache
+    return re.compile(pattern, flags)
+
 
 class PDFExtractor(BaseExtractor):
     """
@@ -107,7 +116,7 @@ class PDFExtractor(BaseExtractor):
         
         extracted_fields = {}
         for field_name, pattern in field_patterns.items():
-            match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
+            match = _compile(pattern, _FIELD_FLAGS).search(text)
             extracted_fields[field_name] = match.group(1) if match else None
         
         return {
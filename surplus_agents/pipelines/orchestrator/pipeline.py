@@ -1,14 +1,26 @@
 """Pipeline orchestrator for managing multi-stage workflows."""
 
-from typing import Any, Dict, List, Optional, Callable
-from dataclasses import dataclass, asdict
-from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Callable, Set, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import reduce
+from itertools import groupby, repeat
 from pathlib import Path
+import asyncio
+import copy
+import hashlib
 import json
+import os
+import threading
+import time
 import traceback
 
+from ...core.storage import dumps_json, write_file
+from ...core.timeutils import utc_now_iso
 
-@dataclass
+
+@dataclass(slots=True)
 class PipelineStage:
     """Represents a single stage in a pipeline."""
     name: str
@@ -17,6 +29,8 @@ class PipelineStage:
     required: bool = True
     retry_on_error: bool = False
     max_retries: int = 3
+    parallel_group: Optional[str] = None
+    cacheable: bool = False
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary (exclude handler)."""
@@ -25,11 +39,13 @@ class PipelineStage:
             'description': self.description,
             'required': self.required,
             'retry_on_error': self.retry_on_error,
-            'max_retries': self.max_retries
+            'max_retries': self.max_retries,
+            'parallel_group': self.parallel_group,
+            'cacheable': self.cacheable
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class StageResult:
     """Result of executing a pipeline stage."""
     stage_name: str
@@ -40,8 +56,59 @@ class StageResult:
     timestamp: str = ""
     
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary."""
-        return asdict(self)
+        """Convert to dictionary (``output`` is shared, not deep-copied)."""
+        return {
+            'stage_name': self.stage_name,
+            'status': self.status,
+            'output': self.output,
+            'error': self.error,
+            'duration_ms': self.duration_ms,
+            'timestamp': self.timestamp
+        }
+
+
+# Exact types _input_digest accepts: values that encode to JSON one-to-one.
+# Subclasses (bool-like ints, str enums), tuples and non-str keys are left out
+# because json/orjson would encode them the same as a different plain value.
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_plain_json(value: Any, path: Set[int]) -> bool:
+    """Whether value is built only from dict (str keys), list, str, int, float, bool and None."""
+    kind = type(value)
+    if kind is dict:
+        children = value.values()
+        if not all(type(k) is str for k in value):
+            return False
+    elif kind is list:
+        children = value
+    else:
+        return kind in _JSON_SCALARS
+    if id(value) in path:
+        return False  # cycle
+    path.add(id(value))
+    ok = all(_is_plain_json(child, path) for child in children)
+    path.discard(id(value))
+    return ok
+
+
+def _input_digest(data: Any) -> Optional[bytes]:
+    """Digest of data's canonical JSON (sorted keys); None if it is not plain JSON data."""
+    try:
+        if not _is_plain_json(data, set()):
+            return None  # dates, tuples, dataclasses, cycles, ...: run the stage uncached
+        buf = json.dumps(data, sort_keys=True, separators=(",", ":"), allow_nan=False)
+    except (ValueError, RecursionError):
+        return None  # NaN/Infinity, or nesting too deep
+    return hashlib.blake2b(buf.encode("utf-8"), digest_size=16).digest()
+
+
+def _last_not_none(outputs: List[Any]) -> Any:
+    """Default parallel-group merge: the last output that is not None."""
+    for output in reversed(outputs):
+        if output is not None:
+            return output
+    return None
 
 
 class PipelineOrchestrator:
@@ -50,18 +117,24 @@ class PipelineOrchestrator:
     
     Features:
     - Stage-by-stage execution with dependencies
+    - Concurrent execution of independent stages (parallel groups)
+    - Output caching for deterministic stages
     - Error handling and retry logic
     - Progress tracking and reporting
     - Audit logging
     - TEST/DRY_RUN/LIVE mode support
     """
     
+    # Most cached stage outputs kept per orchestrator (least recently used evicted)
+    STAGE_CACHE_SIZE = 256
+    
     def __init__(
         self,
         name: str,
         mode: str = "TEST",
         audit_logger: Optional[Any] = None,
-        artifact_dir: Optional[Path] = None
+        artifact_dir: Optional[Path] = None,
+        merge_outputs: Optional[Callable[[List[Any]], Any]] = None
     ):
         """
         Initialize pipeline orchestrator.
@@ -71,13 +144,22 @@ class PipelineOrchestrator:
             mode: Operating mode (TEST, DRY_RUN, LIVE)
             audit_logger: Audit logger instance
             artifact_dir: Directory for artifacts
+            merge_outputs: Combines the outputs of a parallel group's successful
+                stages (in stage order) into the next stage's input
+                (default: the last non-None output)
         """
         self.name = name
         self.mode = mode
         self.audit_logger = audit_logger
         self.artifact_dir = Path(artifact_dir) if artifact_dir else Path("./artifacts")
+        self.merge_outputs = merge_outputs or _last_not_none
         self.stages: List[PipelineStage] = []
         self.stage_results: List[StageResult] = []
+        # stage name -> first StageResult with that name, for get_stage_result()
+        self._stage_index: Dict[str, StageResult] = {}
+        # (stage name, input digest) -> (handler, output) for cacheable stages
+        self._stage_cache: "OrderedDict[Tuple[str, bytes], Tuple[Callable, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def add_stage(
         self,
@@ -86,18 +168,33 @@ class PipelineOrchestrator:
         description: str = "",
         required: bool = True,
         retry_on_error: bool = False,
-        max_retries: int = 3
+        max_retries: int = 3,
+        parallel_group: Optional[str] = None,
+        cacheable: bool = False
     ) -> None:
         """
         Add a stage to the pipeline.
         
         Args:
             name: Stage name
-            handler: Function to execute for this stage
+            handler: Function to execute for this stage. It receives the previous
+                stage's output as-is (never copied), so it may update that object
+                in place and return it instead of building a new one; stages in
+                a parallel group share their input and should not mutate it.
+                Set ``handler.batched = True`` to have execute_batch() call it
+                with a list of inputs
             description: Stage description
             required: Whether stage is required (pipeline fails if required stage fails)
             retry_on_error: Whether to retry on error
             max_retries: Maximum retry attempts
+            parallel_group: Consecutive stages with the same group name run
+                concurrently on the same input; their outputs are combined
+                with merge_outputs
+            cacheable: Whether the handler is a pure function of its input. Its
+                successful outputs are then cached by the input's JSON content
+                and reused (as deep copies) by later runs of this orchestrator;
+                inputs that are not plain JSON data (dict with str keys, list,
+                str, int, float, bool, None) always run the handler
         """
         stage = PipelineStage(
             name=name,
@@ -105,10 +202,33 @@ class PipelineOrchestrator:
             description=description,
             required=required,
             retry_on_error=retry_on_error,
-            max_retries=max_retries
+            max_retries=max_retries,
+            parallel_group=parallel_group,
+            cacheable=cacheable
         )
         self.stages.append(stage)
     
+    def add_fused_stages(self, name: str, handlers: List[Callable], **kwargs) -> None:
+        """
+        Add a chain of handlers as a single stage.
+        
+        Each handler receives the previous one's output, as with separate stages,
+        but the chain gets one StageResult and one audit entry; a failure in any
+        handler fails (and, with retry_on_error, retries) the whole chain.
+        
+        Args:
+            name: Stage name
+            handlers: Functions to run in order
+            **kwargs: Other add_stage() options (description, required, ...)
+        """
+        handlers = list(handlers)
+        
+        def fused(data: Any) -> Any:
+            return reduce(lambda acc, handler: handler(acc), handlers, data)
+        
+        fused.__name__ = name
+        self.add_stage(name, fused, **kwargs)
+    
     def execute(self, initial_data: Any) -> Dict[str, Any]:
         """
         Execute the pipeline.
@@ -119,8 +239,10 @@ class PipelineOrchestrator:
         Returns:
             Pipeline execution result
         """
-        start_time = datetime.now(timezone.utc)
+        start_time = utc_now_iso()
+        start_ns = time.perf_counter_ns()
         self.stage_results = []
+        self._stage_index = {}
         current_data = initial_data
         
         if self.audit_logger:
@@ -133,36 +255,54 @@ class PipelineOrchestrator:
                 details={"stage_count": len(self.stages)}
             )
         
-        # Execute each stage
-        for stage in self.stages:
-            result = self._execute_stage(stage, current_data)
-            self.stage_results.append(result)
-            
-            if result.status == "error":
-                if stage.required:
-                    # Required stage failed, stop pipeline
-                    break
-                # Non-required stage failed, continue
+        # Stage tallies for status and metadata, kept while the stages run
+        successful_stages = 0
+        failed_stages = 0
+        failed_required = False
+        
+        # Execute each batch of stages (bound methods hoisted out of the loop)
+        execute_stage = self._execute_stage
+        append_result = self.stage_results.append
+        index_result = self._stage_index.setdefault
+        for batch in self._stage_batches():
+            if len(batch) == 1:
+                results = [execute_stage(batch[0], current_data)]
             else:
-                # Update current_data with stage output
-                current_data = result.output
+                with ThreadPoolExecutor(max_workers=len(batch)) as pool:
+                    results = list(pool.map(execute_stage, batch, repeat(current_data)))
+            
+            outputs = []
+            for stage, result in zip(batch, results):
+                append_result(result)
+                index_result(result.stage_name, result)
+                
+                if result.status == "error":
+                    failed_stages += 1
+                    if stage.required:
+                        failed_required = True
+                    # Non-required stage failed, continue
+                else:
+                    if result.status == "ok":
+                        successful_stages += 1
+                    outputs.append(result.output)
+            
+            if failed_required:
+                # Required stage failed, stop pipeline
+                break
+            # Update current_data with stage output(s)
+            if outputs:
+                current_data = outputs[0] if len(batch) == 1 else self.merge_outputs(outputs)
         
         # Determine overall pipeline status
-        has_errors = any(r.status == "error" for r in self.stage_results)
-        failed_required = any(
-            r.status == "error" and s.required
-            for r, s in zip(self.stage_results, self.stages)
-        )
-        
         if failed_required:
             status = "error"
-        elif has_errors:
+        elif failed_stages:
             status = "partial"
         else:
             status = "ok"
         
-        end_time = datetime.now(timezone.utc)
-        duration_ms = int((end_time - start_time).total_seconds() * 1000)
+        end_time = utc_now_iso()
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
         
         pipeline_result = {
             "pipeline": self.name,
@@ -171,12 +311,12 @@ class PipelineOrchestrator:
             "output": current_data,
             "stages": [r.to_dict() for r in self.stage_results],
             "metadata": {
-                "start_time": start_time.isoformat(),
-                "end_time": end_time.isoformat(),
+                "start_time": start_time,
+                "end_time": end_time,
                 "duration_ms": duration_ms,
                 "total_stages": len(self.stages),
-                "successful_stages": sum(1 for r in self.stage_results if r.status == "ok"),
-                "failed_stages": sum(1 for r in self.stage_results if r.status == "error")
+                "successful_stages": successful_stages,
+                "failed_stages": failed_stages
             }
         }
         
@@ -195,6 +335,159 @@ class PipelineOrchestrator:
         
         return pipeline_result
     
+    async def execute_async(self, initial_data: Any) -> Dict[str, Any]:
+        """
+        Execute the pipeline from async code without blocking the event loop.
+        
+        Runs execute() (stage handlers, audit logging and the result-file
+        write) in a worker thread. Awaiting two runs on the same orchestrator
+        concurrently is not supported; use one orchestrator per run.
+        
+        Args:
+            initial_data: Initial input data for the pipeline
+            
+        Returns:
+            Pipeline execution result
+        """
+        return await asyncio.to_thread(self.execute, initial_data)
+    
+    def execute_batch(self, inputs: List[Any], batch_size: int = 1000) -> List[Dict[str, Any]]:
+        """
+        Execute the pipeline over many inputs, one stage at a time.
+        
+        Inputs are processed in chunks of batch_size; each stage runs over a
+        whole chunk before the next stage starts. A handler with a truthy
+        ``batched`` attribute is called once per chunk with the list of inputs
+        and must return a list with one output per input; other handlers are
+        called per input. An input whose required stage fails stops there
+        without affecting the others. Stages in a parallel group share their
+        input and are merged as in execute(), but run one after another.
+        
+        Unlike execute(), nothing is written to artifact_dir and
+        stage_results is left untouched.
+        
+        Args:
+            inputs: Initial input data, one item per pipeline run
+            batch_size: Maximum number of inputs per chunk
+            
+        Returns:
+            One result per input, in order, shaped like execute()'s result
+            without "metadata"
+        """
+        if batch_size < 1:
+            raise ValueError(f"Invalid batch_size: {batch_size}. Must be at least 1")
+        
+        if self.audit_logger:
+            self.audit_logger.log(
+                action="pipeline_batch_start",
+                actor=self.name,
+                object_type="pipeline",
+                object_id=self.name,
+                result="ok",
+                details={"stage_count": len(self.stages), "input_count": len(inputs)}
+            )
+        
+        results: List[Dict[str, Any]] = []
+        for start in range(0, len(inputs), batch_size):
+            current = list(inputs[start:start + batch_size])
+            stage_results: List[List[StageResult]] = [[] for _ in current]
+            failed_stages = [0] * len(current)
+            failed_required = [False] * len(current)
+            
+            for batch in self._stage_batches():
+                active = [i for i in range(len(current)) if not failed_required[i]]
+                if not active:
+                    break
+                outputs: Dict[int, List[Any]] = {i: [] for i in active}
+                
+                for stage in batch:
+                    chunk = self._execute_stage_over(stage, [current[i] for i in active])
+                    for i, result in zip(active, chunk):
+                        stage_results[i].append(result)
+                        if result.status == "error":
+                            failed_stages[i] += 1
+                            if stage.required:
+                                failed_required[i] = True
+                        else:
+                            outputs[i].append(result.output)
+                
+                for i in active:
+                    if not failed_required[i] and outputs[i]:
+                        current[i] = outputs[i][0] if len(batch) == 1 else self.merge_outputs(outputs[i])
+            
+            for i, data in enumerate(current):
+                if failed_required[i]:
+                    status = "error"
+                elif failed_stages[i]:
+                    status = "partial"
+                else:
+                    status = "ok"
+                results.append({
+                    "pipeline": self.name,
+                    "status": status,
+                    "mode": self.mode,
+                    "output": data,
+                    "stages": [r.to_dict() for r in stage_results[i]]
+                })
+        
+        if self.audit_logger:
+            self.audit_logger.log(
+                action="pipeline_batch_complete",
+                actor=self.name,
+                object_type="pipeline",
+                object_id=self.name,
+                result="ok",
+                details={
+                    "input_count": len(inputs),
+                    "failed_inputs": sum(1 for r in results if r["status"] == "error")
+                }
+            )
+        
+        return results
+    
+    def _execute_stage_over(self, stage: PipelineStage, values: List[Any]) -> List[StageResult]:
+        """Run one stage over a chunk of inputs: one call if the handler is batched."""
+        if not getattr(stage.handler, "batched", False):
+            return [self._execute_stage(stage, value) for value in values]
+        
+        result = self._execute_stage(stage, values)
+        if result.status == "ok":
+            if isinstance(result.output, list) and len(result.output) == len(values):
+                return [
+                    StageResult(
+                        stage_name=stage.name,
+                        status="ok",
+                        output=output,
+                        duration_ms=result.duration_ms,
+                        timestamp=result.timestamp
+                    )
+                    for output in result.output
+                ]
+            result.error = (
+                f"Batched handler returned {type(result.output).__name__} "
+                f"instead of a list of {len(values)} outputs"
+            )
+        return [
+            StageResult(
+                stage_name=stage.name,
+                status="error",
+                output=None,
+                error=result.error,
+                duration_ms=result.duration_ms,
+                timestamp=result.timestamp
+            )
+            for _ in values
+        ]
+    
+    def _stage_batches(self) -> Iterator[List[PipelineStage]]:
+        """Yield stages in run order: a run of same-group stages together, others alone."""
+        for group, stages in groupby(self.stages, key=lambda s: s.parallel_group):
+            if group is None:
+                for stage in stages:
+                    yield [stage]
+            else:
+                yield list(stages)
+    
     def _execute_stage(self, stage: PipelineStage, input_data: Any) -> StageResult:
         """
         Execute a single pipeline stage.
@@ -206,10 +499,34 @@ class PipelineOrchestrator:
         Returns:
             Stage execution result
         """
-        import time
+        start_ns = time.perf_counter_ns()
+        timestamp = utc_now_iso()
+        
+        cache_key = None
+        if stage.cacheable:
+            digest = _input_digest(input_data)
+            if digest is not None:
+                cache_key = (stage.name, digest)
+                cached = self._cache_get(cache_key, stage.handler)
+                if cached is not None:
+                    duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+                    if self.audit_logger:
+                        self.audit_logger.log(
+                            action="stage_execute",
+                            actor=self.name,
+                            object_type="stage",
+                            object_id=stage.name,
+                            result="ok",
+                            details={"attempts": 0, "duration_ms": duration_ms, "cache_hit": True}
+                        )
+                    return StageResult(
+                        stage_name=stage.name,
+                        status="ok",
+                        output=copy.deepcopy(cached[0]),
+                        duration_ms=duration_ms,
+                        timestamp=timestamp
+                    )
         
-        start_time = time.time()
-        timestamp = datetime.now(timezone.utc).isoformat()
         attempts = 0
         max_attempts = stage.max_retries + 1 if stage.retry_on_error else 1
         
@@ -220,7 +537,10 @@ class PipelineOrchestrator:
             
             try:
                 output = stage.handler(input_data)
-                duration_ms = int((time.time() - start_time) * 1000)
+                duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+                
+                if cache_key is not None:
+                    self._cache_put(cache_key, stage.handler, output)
                 
                 if self.audit_logger:
                     self.audit_logger.log(
@@ -248,21 +568,24 @@ class PipelineOrchestrator:
                     continue
                 
                 # All retries exhausted
-                duration_ms = int((time.time() - start_time) * 1000)
+                duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
                 
                 if self.audit_logger:
+                    details = {
+                        "error": last_error,
+                        "attempts": attempts,
+                        "duration_ms": duration_ms
+                    }
+                    # Formatting walks the whole stack; only do it if the logger keeps it
+                    if getattr(self.audit_logger, "capture_tracebacks", True):
+                        details["traceback"] = traceback.format_exc()
                     self.audit_logger.log(
                         action="stage_execute",
                         actor=self.name,
                         object_type="stage",
                         object_id=stage.name,
                         result="error",
-                        details={
-                            "error": last_error,
-                            "attempts": attempts,
-                            "duration_ms": duration_ms,
-                            "traceback": traceback.format_exc()
-                        }
+                        details=details
                     )
                 
                 return StageResult(
@@ -282,13 +605,46 @@ class PipelineOrchestrator:
             error="Unknown error"
         )
     
+    def _cache_get(self, key: Tuple[str, bytes], handler: Callable) -> Optional[Tuple[Any]]:
+        """Cached output for key as a 1-tuple, or None on a miss (or a different handler)."""
+        with self._cache_lock:
+            entry = self._stage_cache.get(key)
+            if entry is None or entry[0] is not handler:
+                return None
+            self._stage_cache.move_to_end(key)
+            return (entry[1],)
+    
+    def _cache_put(self, key: Tuple[str, bytes], handler: Callable, output: Any) -> None:
+        """Store a private copy of output, so later stages may mutate theirs."""
+        entry = (handler, copy.deepcopy(output))
+        with self._cache_lock:
+            self._stage_cache[key] = entry
+            self._stage_cache.move_to_end(key)
+            while len(self._stage_cache) > self.STAGE_CACHE_SIZE:
+                self._stage_cache.popitem(last=False)
+    
+    def clear_stage_cache(self) -> None:
+        """Drop all cached stage outputs."""
+        with self._cache_lock:
+            self._stage_cache.clear()
+    
     def _save_result(self, result: Dict[str, Any]) -> None:
         """Save pipeline result to artifact directory."""
         self.artifact_dir.mkdir(parents=True, exist_ok=True)
         result_file = self.artifact_dir / f"{self.name}_result.json"
         
-        with result_file.open('w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        # Encode up front (orjson when installed) and write once, to a temp file
+        # renamed over the result so readers never see a partially written file.
+        # The name is unique per thread: concurrent runs may share a name and directory
+        tmp_file = result_file.with_name(
+            f"{result_file.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        try:
+            write_file(tmp_file, dumps_json(result))
+            os.replace(tmp_file, result_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
     
     def get_stage_results(self) -> List[StageResult]:
         """Get results of all executed stages."""
@@ -296,7 +652,4 @@ class PipelineOrchestrator:
     
     def get_stage_result(self, stage_name: str) -> Optional[StageResult]:
         """Get result of a specific stage by name."""
-        for result in self.stage_results:
-            if result.stage_name == stage_name:
-                return result
-        return None
+        return self._stage_index.get(stage_name)
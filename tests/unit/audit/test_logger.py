@@ -131,3 +131,126 @@ def test_audit_entry_to_dict():
     assert entry_dict["actor"] == "test_agent"
     assert entry_dict["mode"] == "TEST"
     assert entry_dict["details"]["key"] == "value"
+
+
+@pytest.mark.unit
+def test_audit_logger_timestamp_format(temp_audit_dir):
+    """Test timestamps are UTC ISO-8601 with microseconds."""
+    from datetime import datetime, timezone
+    
+    logger = AuditLogger(temp_audit_dir, mode="TEST")
+    before = datetime.now(timezone.utc)
+    entry = logger.log(action="test", actor="a", object_type="t", object_id="1", result="ok")
+    after = datetime.now(timezone.utc)
+    
+    parsed = datetime.fromisoformat(entry.timestamp)
+    assert parsed.tzinfo == timezone.utc
+    assert before.replace(microsecond=0) <= parsed <= after
+
+
+@pytest.mark.unit
+def test_audit_logger_get_entries_combined_filters(temp_audit_dir):
+    """Test combined filters and entries appended directly."""
+    logger = AuditLogger(temp_audit_dir, mode="TEST")
+    logger.log(action="fetch", actor="a", object_type="page", object_id="1", result="ok")
+    logger.log(action="fetch", actor="b", object_type="page", object_id="2", result="error")
+    logger.log(action="parse", actor="a", object_type="page", object_id="3", result="ok")
+    
+    assert [e.object_id for e in logger.get_entries(action="fetch", result="ok")] == ["1"]
+    assert [e.object_id for e in logger.get_entries(actor="a")] == ["1", "3"]
+    assert logger.get_entries(action="missing") == []
+    
+    logger.entries.clear()
+    logger.log(action="fetch", actor="a", object_type="page", object_id="4", result="ok")
+    assert [e.object_id for e in logger.get_entries(action="fetch")] == ["4"]
+
+
+@pytest.mark.unit
+def test_audit_logger_iterators(temp_audit_dir):
+    """Test lazy iteration over entries and audit files."""
+    logger = AuditLogger(temp_audit_dir, mode="TEST")
+    logger.log("create", "agent1", "doc", "1", "ok")
+    logger.log("update", "agent1", "doc", "1", "error")
+    audit_file = logger.save()
+    
+    errors = logger.iter_entries(result="error")
+    assert not isinstance(errors, list)
+    assert [e.action for e in errors] == ["update"]
+    assert [e["action"] for e in AuditLogger.iter_from_file(audit_file)] == ["create", "update"]
+    assert list(AuditLogger.iter_from_file(temp_audit_dir / "missing.jsonl")) == []
+
+
+@pytest.mark.unit
+def test_audit_logger_incremental_save(temp_audit_dir):
+    """Test repeated saves append only new entries."""
+    with AuditLogger(temp_audit_dir, mode="TEST") as logger:
+        logger.log("create", "agent1", "doc", "1", "ok")
+        audit_file = logger.save()
+        logger.log("update", "agent1", "doc", "1", "ok")
+        logger.save()
+        logger.save()
+    
+    loaded = AuditLogger.load_from_file(audit_file)
+    assert [e["action"] for e in loaded] == ["create", "update"]
+    
+    # Entries logged after clearing the list are all written
+    with AuditLogger(temp_audit_dir, mode="TEST") as logger:
+        for i in range(3):
+            logger.log("create", "agent1", "doc", str(i), "ok")
+        audit_file = logger.save("cleared.jsonl")
+        logger.entries.clear()
+        for i in range(3, 8):
+            logger.log("create", "agent1", "doc", str(i), "ok")
+        logger.save("cleared.jsonl")
+    
+    loaded = AuditLogger.load_from_file(audit_file)
+    assert [e["object_id"] for e in loaded] == [str(i) for i in range(8)]
+
+
+@pytest.mark.unit
+def test_audit_logger_save_after_file_removed(temp_audit_dir):
+    """Test save() writes to a new file when the audit file is deleted or rotated between saves."""
+    with AuditLogger(temp_audit_dir, mode="TEST") as logger:
+        logger.log("create", "agent1", "doc", "1", "ok")
+        audit_file = logger.save()
+        audit_file.unlink()
+        logger.log("create", "agent1", "doc", "2", "ok")
+        logger.save()
+        assert [e["object_id"] for e in AuditLogger.load_from_file(audit_file)] == ["2"]
+        
+        rotated = audit_file.with_name("audit.jsonl.1")
+        audit_file.rename(rotated)
+        logger.log("create", "agent1", "doc", "3", "ok")
+        logger.save()
+    
+    assert [e["object_id"] for e in AuditLogger.load_from_file(rotated)] == ["2"]
+    assert [e["object_id"] for e in AuditLogger.load_from_file(audit_file)] == ["3"]
+
+
+@pytest.mark.unit
+def test_audit_logger_save_details(temp_audit_dir):
+    """Test saved lines round-trip details, including non-string keys."""
+    with AuditLogger(temp_audit_dir, mode="TEST") as logger:
+        logger.log("create", "agent1", "doc", "1", "ok", {"name": "café", "values": [1, 2.5, None]})
+        logger.log("create", "agent1", "doc", "2", "ok", {None: 1, 3: "x"})
+        audit_file = logger.save()
+    
+    lines = audit_file.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["details"] for line in lines] == [
+        {"name": "café", "values": [1, 2.5, None]},
+        {"null": 1, "3": "x"},
+    ]
+
+
+@pytest.mark.unit
+def test_audit_logger_save_non_finite(temp_audit_dir):
+    """Test NaN/Infinity in details are saved as such and read back."""
+    import math
+    
+    with AuditLogger(temp_audit_dir, mode="TEST") as logger:
+        logger.log("score", "agent1", "doc", "1", "ok", {"score": float("nan"), "max": float("inf")})
+        audit_file = logger.save()
+    
+    (entry,) = AuditLogger.load_from_file(audit_file)
+    assert math.isnan(entry["details"]["score"])
+    assert entry["details"]["max"] == float("inf")
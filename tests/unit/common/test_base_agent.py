@@ -0,0 +1,38 @@
+"""Unit tests for BaseAgent."""
+
+import pytest
+
+from common.base_agent import BaseAgent
+
+
+class EchoAgent(BaseAgent):
+    """Agent returning its payload; module-level so the process pool can pickle it."""
+    
+    agent_name = "echo"
+    
+    def _run(self, payload, run_config, artifact_dir):
+        if payload.get("fail"):
+            raise ValueError("bad payload")
+        return {"n": payload["n"]}, [], []
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_run_many(tmp_path, executor):
+    """Test run_many keeps payload order, captures errors and gives each run its own directory."""
+    payloads = [{"n": 0}, {"n": 1, "fail": True}, {"n": 2}]
+    run_config = {"artifact_dir": str(tmp_path), "run_id": "batch"}
+    
+    results = EchoAgent().run_many(payloads, run_config, max_workers=2, executor=executor)
+    
+    assert [r["status"] for r in results] == ["ok", "error", "ok"]
+    assert [r["data"] for r in results] == [{"n": 0}, {}, {"n": 2}]
+    assert [r["run_id"] for r in results] == ["batch-0", "batch-1", "batch-2"]
+    assert all((tmp_path / "echo" / f"batch-{i}" / "result.json").exists() for i in range(3))
+
+
+@pytest.mark.unit
+def test_run_many_invalid_executor(tmp_path):
+    """Test unknown executors are rejected."""
+    with pytest.raises(ValueError):
+        EchoAgent().run_many([{"n": 0}], {"artifact_dir": str(tmp_path)}, executor="fiber")
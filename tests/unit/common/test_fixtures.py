@@ -0,0 +1,30 @@
+"""Unit tests for the fixture store."""
+
+import os
+
+import pytest
+
+from common.fixtures import FixtureStore
+
+
+@pytest.mark.unit
+def test_read_text_rereads_changed_fixture(tmp_path):
+    """Test cached fixture reads pick up a rewritten file."""
+    page = tmp_path / "page.html"
+    page.write_text("<p>old</p>", encoding="utf-8")
+    store = FixtureStore(str(tmp_path))
+    
+    assert store.read_text("page.html") == "<p>old</p>"
+    assert store.read_text("page.html") == "<p>old</p>"
+    
+    page.write_text("<p>newer</p>", encoding="utf-8")
+    assert store.read_text("page.html") == "<p>newer</p>"
+    
+    # Same size: the changed mtime alone invalidates the cached text
+    mtime_ns = page.stat().st_mtime_ns
+    page.write_text("<p>later</p>", encoding="utf-8")
+    os.utime(page, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+    assert store.read_text("page.html") == "<p>later</p>"
+    
+    with pytest.raises(FileNotFoundError):
+        store.read_text("missing.html")
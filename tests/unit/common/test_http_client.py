@@ -0,0 +1,69 @@
+"""Unit tests for the shared HTTP client."""
+
+import os
+
+import httpx
+import pytest
+
+from common import http_client
+from common.fixtures import FixtureStore
+from common.http_client import HttpClient
+
+
+@pytest.fixture
+def fixture_store(tmp_path):
+    """Fixture store with two pages."""
+    (tmp_path / "a.html").write_text("<p>a</p>", encoding="utf-8")
+    (tmp_path / "b.html").write_text("<p>b</p>", encoding="utf-8")
+    return FixtureStore(str(tmp_path))
+
+
+@pytest.mark.unit
+def test_get_texts_network_off(fixture_store):
+    """Test batched fixture reads keep url order."""
+    client = HttpClient(network="OFF", fixtures=fixture_store)
+    
+    texts = client.get_texts(["u1", "u2", "u3"], fixture_keys=["b.html", "a.html", "b.html"])
+    
+    assert texts == ["<p>b</p>", "<p>a</p>", "<p>b</p>"]
+    with pytest.raises(ValueError):
+        client.get_texts(["u1", "u2"], fixture_keys=["a.html"])
+
+
+@pytest.mark.unit
+def test_get_texts_network_on(monkeypatch):
+    """Test live batches return bodies in url order and raise on HTTP errors."""
+    def handler(request):
+        if request.url.path == "/missing":
+            return httpx.Response(404)
+        return httpx.Response(200, text=f"body {request.url.path}")
+    
+    transport = httpx.MockTransport(handler)
+    real_async_client = httpx.AsyncClient
+    monkeypatch.setattr(
+        http_client.httpx, "AsyncClient",
+        lambda **kwargs: real_async_client(transport=transport, **kwargs)
+    )
+    client = HttpClient(network="ON")
+    urls = [f"https://example.test/{i}" for i in range(20)]
+    
+    assert client.get_texts(urls, max_concurrency=4) == [f"body /{i}" for i in range(20)]
+    assert client.get_texts([]) == []
+    with pytest.raises(httpx.HTTPStatusError):
+        client.get_texts(["https://example.test/missing"])
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_shared_client_reset_in_forked_child():
+    """Test a forked child builds its own client instead of reusing the parent's sockets."""
+    parent_client = http_client._shared_client()
+    
+    pid = os.fork()
+    if pid == 0:
+        ok = http_client._client is None and http_client._shared_client() is not parent_client
+        os._exit(0 if ok else 1)
+    
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert http_client._shared_client() is parent_client
@@ -0,0 +1,53 @@
+"""Unit tests for logging setup."""
+
+import atexit
+import logging
+from logging.handlers import QueueHandler
+
+import pytest
+
+from surplus_agents.core.logging import _CachedTimeFormatter, setup_logger
+
+
+@pytest.mark.unit
+def test_setup_logger_queue_writes_file(tmp_path, monkeypatch):
+    """Test SURPLUS_LOG_QUEUE=1 routes records through a QueueListener into the log file."""
+    monkeypatch.setenv("SURPLUS_LOG_QUEUE", "1")
+    log_file = tmp_path / "logs" / "run.log"
+    logger = setup_logger("test_setup_logger_queue", log_file=log_file, mode="TEST")
+    (queue_handler,) = [h for h in logger.handlers if isinstance(h, QueueHandler)]
+    assert not any(isinstance(h, logging.FileHandler) for h in logger.handlers)
+    
+    try:
+        for i in range(3):
+            logger.info("line %d", i)
+        logger.debug("below level")
+    finally:
+        listener = queue_handler.listener
+        listener.stop()  # drains the queue
+        atexit.unregister(listener.stop)
+        for handler in listener.handlers:
+            handler.close()
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+    
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert [line.split("] ")[-1] for line in lines] == ["line 0", "line 1", "line 2"]
+    assert all("[test_setup_logger_queue] [TEST] [INFO]" in line for line in lines)
+
+
+
+@pytest.mark.unit
+def test_cached_time_formatter_matches_formatter():
+    """Test the cached asctime matches logging.Formatter's across a second boundary."""
+    fmt = "[%(asctime)s] %(message)s"
+    datefmt = "%Y-%m-%d %H:%M:%S"
+    cached = _CachedTimeFormatter(fmt, datefmt=datefmt)
+    plain = logging.Formatter(fmt, datefmt=datefmt)
+    
+    for created in (1_700_000_000.25, 1_700_000_000.999, 1_700_000_001.0, 1_700_000_001.5, 1_700_000_000.5):
+        record = logging.makeLogRecord({"msg": "m", "created": created, "msecs": (created % 1) * 1000})
+        assert cached.formatTime(record, datefmt) == plain.formatTime(record, datefmt)
+        assert cached.format(record) == plain.format(record)
+        # No datefmt: defers to logging.Formatter (milliseconds included)
+        assert cached.formatTime(record) == plain.formatTime(record)
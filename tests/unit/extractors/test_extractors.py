@@ -239,3 +239,157 @@ def test_data_normalizer_date():
     # Invalid
     assert normalizer.normalize_date("invalid") is None
     assert normalizer.normalize_date(None) is None
+
+
+@pytest.mark.unit
+def test_data_normalizer_date_numeric_order():
+    """Test numeric dates resolve in the same order as the strptime formats."""
+    normalizer = DataNormalizer()
+    
+    assert normalizer.normalize_date("1-5-2024") == "2024-01-05"
+    assert normalizer.normalize_date("05/04/2024") == "2024-05-04"  # month first
+    assert normalizer.normalize_date("15/01/2024") == "2024-01-15"  # day first fallback
+    assert normalizer.normalize_date("02/30/2024") is None
+    assert normalizer.normalize_date("2024-02-29", output_format="%d.%m.%Y") == "29.02.2024"
+
+
+@pytest.mark.unit
+def test_html_extractor_table_matches_bs4():
+    """Test the lxml table path matches the BeautifulSoup path, including large inputs."""
+    rows = "".join(f"<tr><td> {i} </td><td><b>x</b>{i}<script>s()</script></td></tr>" for i in range(500))
+    html = f"<table><thead><tr><th>A</th><th>B<!-- c --></th></tr></thead><tbody>{rows}</tbody></table>"
+    extractor = HTMLExtractor(mode="TEST")
+    
+    fast = extractor.extract_table(html)
+    slow = extractor.extract_table(html, parser="lxml", table_selector="table")
+    
+    assert fast == slow
+    assert fast["headers"] == ["A", "B"]
+    assert fast["rows"][1] == ["1", "x1"]
+    assert fast["row_count"] == 500
+
+
+@pytest.mark.unit
+def test_html_extractor_source_detection():
+    """Test sources are read as files only when they name an existing file."""
+    html = "<html><head><title>T</title></head><body><p>Hi</p></body></html>"
+    extractor = HTMLExtractor(mode="TEST")
+    
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "page.html"
+        path.write_text(html, encoding="utf-8")
+        
+        assert extractor.extract(str(path))["data"]["title"] == "T"
+        assert extractor.extract(str(path).encode())["data"]["title"] == "T"
+    
+    assert extractor.extract(html.encode())["data"]["title"] == "T"
+    assert extractor.extract("  " + html)["data"]["title"] == "T"
+    assert extractor.extract("no markup here")["data"]["text"] == "no markup here"
+
+
+@pytest.mark.unit
+def test_html_extractor_include_text():
+    """Test full-page text can be left out of the default extraction."""
+    html = "<html><head><title>T</title></head><body><p>Body</p><a href='/a'>A</a></body></html>"
+    extractor = HTMLExtractor(mode="TEST")
+    
+    assert extractor.extract(html)["data"]["text"] == "T Body A"
+    
+    data = extractor.extract(html, include_text=False)["data"]
+    assert "text" not in data
+    assert data["title"] == "T"
+    assert data["links"] == ["/a"]
+
+
+@pytest.mark.unit
+def test_html_extractor_preparsed_soup():
+    """Test extract reuses an already-parsed document."""
+    from bs4 import BeautifulSoup
+    
+    html = "<html><head><title>T</title></head><body><h1 class='name'>Name</h1></body></html>"
+    extractor = HTMLExtractor(mode="TEST")
+    soup = BeautifulSoup(html, "html.parser")
+    
+    reused = extractor.extract(None, soup=soup, selectors={"name": ".name"})
+    parsed = extractor.extract(html, parser="html.parser", selectors={"name": ".name"})
+    
+    assert reused == parsed
+    assert reused["data"]["name"] == "Name"
+    assert reused["metadata"]["parser"] == "html.parser"
+
+
+@pytest.mark.unit
+def test_html_extractor_selectors_match_bs4(monkeypatch):
+    """Test the lxml/XPath selector path matches BeautifulSoup's select_one on the same parse."""
+    pytest.importorskip("cssselect")
+    from bs4 import BeautifulSoup
+    from surplus_agents.extraction.extractors import html_extractor
+    
+    parsed = []
+    
+    def counting_soup(*args, **kwargs):
+        parsed.append(args)
+        return BeautifulSoup(*args, **kwargs)
+    
+    html = """
+    <html><body>
+        <div class="item first"> <b>One</b> 1<script>s()</script></div>
+        <div class="item">Two</div>
+        <p id="note">Note<!-- c --> text</p>
+        <ul><li>a</li><li>b</li></ul>
+    </body></html>
+    """
+    selectors = {
+        "item": ".item",
+        "second": "div.item:not(.first)",
+        "note": "#note",
+        "last": "ul > li:last-child",
+        "either": "p, ul",
+        "missing": ".missing",
+    }
+    extractor = HTMLExtractor(mode="TEST")
+    soup = BeautifulSoup(html, "lxml")
+    monkeypatch.setattr(html_extractor, "BeautifulSoup", counting_soup)
+    
+    fast = extractor.extract(html, parser="lxml", selectors=selectors)
+    assert parsed == []  # no BeautifulSoup tree was built
+    assert fast == extractor.extract(None, soup=soup, selectors=selectors)
+    assert fast["data"]["item"] == "One1"
+    
+    # soupsieve-only syntax falls back to BeautifulSoup
+    selectors["contains"] = "div:-soup-contains('Two')"
+    fast = extractor.extract(html, parser="lxml", selectors=selectors)
+    assert len(parsed) == 1
+    assert fast == extractor.extract(None, soup=soup, selectors=selectors)
+    assert fast["data"]["contains"] == "Two"
+    
+    # So do attribute-value selectors: soupsieve matches type="TEXT" for [type=text]
+    form = '<form><input type="TEXT" name="q" value="v"></form>'
+    typed = extractor.extract(form, parser="lxml", selectors={"q": "input[type=text]"})
+    assert len(parsed) == 2
+    assert typed == extractor.extract(None, soup=BeautifulSoup(form, "lxml"), selectors={"q": "input[type=text]"})
+    assert typed["data"]["q"] == ""
+    
+    # Input lxml rejects (a str with an encoding declaration) also falls back
+    declared = '<?xml version="1.0" encoding="utf-8"?><html><body><p>x</p></body></html>'
+    assert extractor.extract(declared, parser="lxml", selectors={"x": "p"})["data"] == {"x": "x"}
+    assert len(parsed) == 3
+    
+    assert extractor.extract("", selectors={"x": "p"})["data"] == {"x": None}
+
+
+@pytest.mark.unit
+def test_html_extractor_table_non_text_elements():
+    """Test the lxml table path drops template/ruby text like BeautifulSoup does."""
+    extractor = HTMLExtractor(mode="TEST")
+    
+    for html in (
+        "<table><tr><td>a<template><table><tr><td>z</td></tr></table></template></td><td> b </td></tr></table>",
+        "<template><table><tr><td>q</td></tr></table></template>",
+        "<ruby><table><tr><td>k<rt>r</rt></td></tr></table></ruby>",
+    ):
+        assert extractor.extract_table(html) == extractor.extract_table(html, table_selector="table")
+    
+    assert extractor.extract_table(
+        "<table><tr><td>a<template>z</template></td><td> b </td></tr></table>"
+    )["rows"] == [["a", "b"]]
@@ -1,8 +1,11 @@
 """Unit tests for pipeline orchestrator."""
 
 import pytest
+import asyncio
+import json
 from pathlib import Path
 import tempfile
+import threading
 
 from surplus_agents.pipelines.orchestrator.pipeline import (
     PipelineOrchestrator,
@@ -81,6 +84,33 @@ def test_pipeline_execute_simple(temp_artifact_dir):
     assert len(result["stages"]) == 2
 
 
+@pytest.mark.unit
+def test_pipeline_fused_stage(temp_artifact_dir):
+    """Test fused handlers run in order as a single stage."""
+    audit_logger = AuditLogger(temp_artifact_dir / "audit", mode="TEST")
+    pipeline = PipelineOrchestrator(
+        name="test_pipeline",
+        audit_logger=audit_logger,
+        artifact_dir=temp_artifact_dir
+    )
+    
+    def stage1(data):
+        return {"stage1": data}
+    
+    def stage2(data):
+        data["stage2"] = "done"
+        return data
+    
+    pipeline.add_fused_stages("stage1_2", [stage1, stage2])
+    
+    result = pipeline.execute({"input": "test"})
+    
+    assert result["status"] == "ok"
+    assert result["output"] == {"stage1": {"input": "test"}, "stage2": "done"}
+    assert [s["stage_name"] for s in result["stages"]] == ["stage1_2"]
+    assert len(audit_logger.get_entries(action="stage_execute")) == 1
+
+
 @pytest.mark.unit
 def test_pipeline_stage_error_required(temp_artifact_dir):
     """Test pipeline stops on required stage failure."""
@@ -161,6 +191,30 @@ def test_pipeline_with_audit_logger(temp_artifact_dir):
     assert len(complete_entries) == 1
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("capture", [True, False])
+def test_pipeline_stage_error_traceback(temp_artifact_dir, capture):
+    """Test failed stages log a traceback only when the audit logger wants one."""
+    audit_logger = AuditLogger(temp_artifact_dir / "audit", capture_tracebacks=capture)
+    pipeline = PipelineOrchestrator(
+        name="test_pipeline",
+        audit_logger=audit_logger,
+        artifact_dir=temp_artifact_dir
+    )
+    
+    def stage1(data):
+        raise ValueError("Stage 1 failed")
+    
+    pipeline.add_stage("stage1", stage1)
+    pipeline.execute({"input": "test"})
+    
+    entry = audit_logger.get_entries(action="stage_execute", result="error")[0]
+    assert entry.details["error"] == "Stage 1 failed"
+    assert ("traceback" in entry.details) is capture
+    if capture:
+        assert "ValueError: Stage 1 failed" in entry.details["traceback"]
+
+
 @pytest.mark.unit
 def test_pipeline_retry_on_error(temp_artifact_dir):
     """Test stage retry on error."""
@@ -209,6 +263,22 @@ def test_pipeline_saves_result(temp_artifact_dir):
     assert result_file.exists()
 
 
+@pytest.mark.unit
+def test_pipeline_saved_result_matches_return(temp_artifact_dir):
+    """Test the saved result file holds the returned result."""
+    pipeline = PipelineOrchestrator(
+        name="test_pipeline",
+        artifact_dir=temp_artifact_dir
+    )
+    
+    pipeline.add_stage("stage1", lambda data: {"rows": [{"name": "café", "amount": 1.5}]})
+    result = pipeline.execute({"input": "test"})
+    
+    saved = json.loads((temp_artifact_dir / "test_pipeline_result.json").read_text(encoding="utf-8"))
+    assert saved == result
+    assert saved["stages"][0]["output"]["rows"][0]["name"] == "café"
+
+
 @pytest.mark.unit
 def test_pipeline_get_stage_results(temp_artifact_dir):
     """Test getting stage results."""
@@ -249,3 +319,204 @@ def test_stage_result_to_dict():
     assert result_dict["status"] == "ok"
     assert result_dict["output"]["data"] == "value"
     assert result_dict["duration_ms"] == 100
+
+
+@pytest.mark.unit
+def test_pipeline_parallel_group(temp_artifact_dir):
+    """Test grouped stages run concurrently on the same input and merge their outputs."""
+    audit_logger = AuditLogger(temp_artifact_dir / "audit", mode="TEST")
+    barrier = threading.Barrier(2, timeout=5)
+    
+    def branch(key):
+        def handler(data):
+            barrier.wait()  # both branches must be running at once
+            return {**data, key: True}
+        return handler
+    
+    pipeline = PipelineOrchestrator(
+        name="test_pipeline",
+        audit_logger=audit_logger,
+        artifact_dir=temp_artifact_dir,
+        merge_outputs=lambda outputs: {k: v for out in outputs for k, v in out.items()}
+    )
+    pipeline.add_stage("prepare", lambda data: {"prepared": True})
+    pipeline.add_stage("left", branch("left"), parallel_group="fetch")
+    pipeline.add_stage("right", branch("right"), parallel_group="fetch")
+    pipeline.add_stage("finish", lambda data: sorted(data))
+    
+    result = pipeline.execute({})
+    
+    assert result["status"] == "ok"
+    assert [s["stage_name"] for s in result["stages"]] == ["prepare", "left", "right", "finish"]
+    assert result["output"] == ["left", "prepared", "right"]
+    assert len(audit_logger.get_entries(action="stage_execute")) == 4
+
+
+@pytest.mark.unit
+def test_pipeline_parallel_group_required_failure(temp_artifact_dir):
+    """Test a failed required stage in a group stops the pipeline after the group."""
+    pipeline = PipelineOrchestrator(
+        name="test_pipeline",
+        artifact_dir=temp_artifact_dir
+    )
+    
+    def failing(data):
+        raise ValueError("branch failed")
+    
+    pipeline.add_stage("ok_branch", lambda data: "ok", parallel_group="g")
+    pipeline.add_stage("bad_branch", failing, parallel_group="g")
+    pipeline.add_stage("after", lambda data: data)
+    
+    result = pipeline.execute("input")
+    
+    assert result["status"] == "error"
+    assert [s["status"] for s in result["stages"]] == ["ok", "error"]
+    assert result["output"] == "input"
+
+
+@pytest.mark.unit
+def test_pipeline_execute_async(temp_artifact_dir):
+    """Test execute_async runs the pipeline off the event loop."""
+    pipeline = PipelineOrchestrator(
+        name="test_pipeline",
+        artifact_dir=temp_artifact_dir
+    )
+    loop_thread = threading.get_ident()
+    pipeline.add_stage("stage1", lambda data: {**data, "off_loop": threading.get_ident() != loop_thread})
+    
+    result = asyncio.run(pipeline.execute_async({"input": "test"}))
+    
+    assert result["status"] == "ok"
+    assert result["output"] == {"input": "test", "off_loop": True}
+    assert (temp_artifact_dir / "test_pipeline_result.json").exists()
+
+
+@pytest.mark.unit
+def test_pipeline_execute_batch(temp_artifact_dir):
+    """Test batch execution matches per-input execution and isolates failures."""
+    calls = []
+    
+    def double_all(values):
+        calls.append(len(values))
+        return [v * 2 for v in values]
+    double_all.batched = True
+    
+    def reject_negative(value):
+        if value < 0:
+            raise ValueError("negative")
+        return value + 1
+    
+    pipeline = PipelineOrchestrator(
+        name="test_pipeline",
+        artifact_dir=temp_artifact_dir
+    )
+    pipeline.add_stage("double", double_all)
+    pipeline.add_stage("check", reject_negative)
+    pipeline.add_stage("label", lambda value: f"v{value}")
+    
+    results = pipeline.execute_batch([1, -2, 3], batch_size=2)
+    
+    assert calls == [2, 1]
+    assert [r["status"] for r in results] == ["ok", "error", "ok"]
+    assert [r["output"] for r in results] == ["v3", -4, "v7"]
+    assert [len(r["stages"]) for r in results] == [3, 2, 3]
+    assert results[1]["stages"][1]["error"] == "negative"
+    assert not (temp_artifact_dir / "test_pipeline_result.json").exists()
+
+
+@pytest.mark.unit
+def test_pipeline_execute_batch_bad_batched_output(temp_artifact_dir):
+    """Test a batched handler returning the wrong number of outputs fails every input."""
+    def broken(values):
+        return values[:1]
+    broken.batched = True
+    
+    pipeline = PipelineOrchestrator(
+        name="test_pipeline",
+        artifact_dir=temp_artifact_dir
+    )
+    pipeline.add_stage("broken", broken)
+    
+    results = pipeline.execute_batch(["a", "b"])
+    
+    assert [r["status"] for r in results] == ["error", "error"]
+    assert "instead of a list of 2 outputs" in results[0]["stages"][0]["error"]
+
+
+@pytest.mark.unit
+def test_pipeline_stage_cache(temp_artifact_dir):
+    """Test cacheable stages run once per distinct input and hand out copies."""
+    calls = []
+    
+    def enrich(data):
+        calls.append(data["id"])
+        return {"id": data["id"], "tags": ["a"]}
+    
+    def mutate(data):
+        data["tags"].append("b")
+        return data
+    
+    pipeline = PipelineOrchestrator(
+        name="test_pipeline",
+        artifact_dir=temp_artifact_dir
+    )
+    pipeline.add_stage("enrich", enrich, cacheable=True)
+    pipeline.add_stage("mutate", mutate)
+    
+    first = pipeline.execute({"id": 1})
+    second = pipeline.execute({"id": 1})
+    pipeline.execute({"id": 2})
+    
+    assert calls == [1, 2]
+    assert first["output"] == second["output"] == {"id": 1, "tags": ["a", "b"]}
+    
+    pipeline.clear_stage_cache()
+    pipeline.execute({"id": 1})
+    assert calls == [1, 2, 1]
+
+
+@pytest.mark.unit
+def test_pipeline_stage_cache_plain_json_only(temp_artifact_dir):
+    """Test inputs that JSON-encode like a different value are never served from the cache."""
+    from datetime import date
+    
+    calls = []
+    
+    def describe(data):
+        calls.append(data)
+        return type(data["d"]).__name__
+    
+    pipeline = PipelineOrchestrator(
+        name="test_pipeline",
+        artifact_dir=temp_artifact_dir
+    )
+    pipeline.add_stage("describe", describe, cacheable=True)
+    
+    assert pipeline.execute({"d": date(2024, 1, 1)})["output"] == "date"
+    assert pipeline.execute({"d": "2024-01-01"})["output"] == "str"
+    assert pipeline.execute({"d": (1, 2)})["output"] == "tuple"
+    assert pipeline.execute({"d": [1, 2]})["output"] == "list"
+    assert pipeline.execute({"d": True})["output"] == "bool"
+    assert pipeline.execute({"d": 1})["output"] == "int"
+    assert len(calls) == 6
+
+
+@pytest.mark.unit
+def test_pipeline_concurrent_runs_same_name(temp_artifact_dir):
+    """Test same-named orchestrators can save into one directory concurrently."""
+    def make():
+        pipeline = PipelineOrchestrator(
+            name="test_pipeline",
+            artifact_dir=temp_artifact_dir
+        )
+        pipeline.add_stage("stage1", lambda data: {"n": data, "pad": "x" * 10000})
+        return pipeline
+    
+    async def run_all():
+        return await asyncio.gather(*(make().execute_async(i) for i in range(16)))
+    
+    for _ in range(5):
+        results = asyncio.run(run_all())
+        assert all(r["status"] == "ok" for r in results)
+    
+    assert [p.name for p in temp_artifact_dir.iterdir()] == ["test_pipeline_result.json"]
@@ -0,0 +1,78 @@
+"""Unit tests for the FOIA scraper agent's HTML parsing paths."""
+
+import pytest
+
+from agents.scraper_foia.agent import ScraperFOIAAgent
+
+
+# Links a parser would not see: data-href, and anchors inside a comment or script
+HIDDEN_LINKS_HTML = (
+    '<a data-href="x.pdf" href="page.html">page</a>'
+    '<!-- <a href="c.pdf"> -->'
+    '<script>"<a href=\'s.csv\'>"</script>'
+    '<A title="a > b href=q.pdf" HREF=\'r&amp;1.csv\'>r</A>'
+    '<a href=u.xlsx>u</a>'
+    '<ahref="no.pdf">'
+)
+
+# Cell text bs4 leaves out: comments, script/style contents and ruby annotations
+NON_TEXT_TABLE_HTML = (
+    "<table><tr><th>H</th><th>I</th></tr>"
+    "<tr><td>x<!--c--><b> q </b><script>s</script>y<style>z</style>"
+    "<ruby>k<rt>r</rt></ruby></td><td> a  b </td></tr></table>"
+)
+
+# The outer anchor starts first but ends last
+NESTED_ANCHOR_HTML = '<a href="1.pdf"><div><a href="2.pdf">x</a></div></a><table></table>'
+
+# Header and data cells outside any <tr>
+STRAY_CELLS_HTML = "<table><th>H</th><th>I</th><td>a<td>b<tr><td>c</table>"
+
+
+def _table_parsers():
+    """(name, parse function) for each table-page parser that is installed."""
+    parsers = []
+    for name, module in (("lexbor", "selectolax"), ("lxml", "lxml"), ("bs4", "bs4")):
+        try:
+            __import__(module)
+        except ImportError:
+            continue
+        parsers.append(pytest.param(getattr(ScraperFOIAAgent, f"_parse_{name}"), id=name))
+    return parsers
+
+
+@pytest.mark.unit
+def test_scan_links_skips_hidden_anchors():
+    """Test the regex link scan only reports real href attributes of real <a> tags."""
+    assert ScraperFOIAAgent._scan_links(HIDDEN_LINKS_HTML) == ["r&1.csv", "u.xlsx"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("parse", _table_parsers())
+def test_scan_links_matches_parsers(parse):
+    """Test table-less and table pages report the same links."""
+    links, _ = parse(HIDDEN_LINKS_HTML + "<table></table>")
+    assert links == ScraperFOIAAgent._scan_links(HIDDEN_LINKS_HTML)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("parse", _table_parsers())
+def test_parse_cell_text_matches_bs4(parse):
+    """Test every table parser drops script/style/ruby text like bs4's get_text."""
+    rows = parse(NON_TEXT_TABLE_HTML)[1]
+    assert rows == [{"H": "x q y k", "I": "a  b"}]
+
+
+@pytest.mark.unit
+def test_parse_lxml_nested_anchor_order():
+    """Test the lxml pass reports nested anchors in document order, like bs4's find_all."""
+    pytest.importorskip("lxml")
+    assert ScraperFOIAAgent._parse_lxml(NESTED_ANCHOR_HTML)[0] == ["1.pdf", "2.pdf"]
+
+
+@pytest.mark.unit
+def test_parse_lexbor_malformed_html():
+    """Test lexbor's HTML5 output on malformed pages (it differs from lxml/bs4 there)."""
+    pytest.importorskip("selectolax")
+    assert ScraperFOIAAgent._parse_lexbor(NESTED_ANCHOR_HTML)[0] == ["1.pdf", "1.pdf", "2.pdf"]
+    assert ScraperFOIAAgent._parse_lexbor(STRAY_CELLS_HTML)[1] == [{"H": "a", "I": "b"}, {"H": "c"}]
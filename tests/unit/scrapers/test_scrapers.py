@@ -2,7 +2,7 @@
 
 import pytest
 from unittest.mock import Mock, MagicMock
-import time
+from datetime import datetime, timezone
 
 from surplus_agents.crawler.scrapers.base import BaseScraper
 from surplus_agents.crawler.scrapers.county_scraper import CountyWebsiteScraper
@@ -27,17 +27,35 @@ def test_base_scraper_initialization():
 
 
 @pytest.mark.unit
-def test_base_scraper_rate_limiting():
+def test_base_scraper_rate_limiting(monkeypatch):
     """Test rate limiting functionality."""
-    scraper = TestScraper(mode="TEST", rate_limit_seconds=0.1)
+    # Virtual clock: sleep() advances monotonic() instead of waiting
+    clock = {"now": 100.0}
+    sleeps = []
     
-    start_time = time.time()
+    def fake_sleep(seconds):
+        sleeps.append(seconds)
+        clock["now"] += seconds
+    
+    monkeypatch.setattr("surplus_agents.crawler.scrapers.base.time.monotonic", lambda: clock["now"])
+    monkeypatch.setattr("surplus_agents.crawler.scrapers.base.time.sleep", fake_sleep)
+    
+    scraper = TestScraper(mode="TEST", rate_limit_seconds=0.25)
+    
+    start_time = clock["now"]
     scraper.scrape("http://example.com")
+    clock["now"] += 0.125  # work between requests counts toward the gap
     scraper.scrape("http://example.com")
-    elapsed = time.time() - start_time
+    elapsed = clock["now"] - start_time
     
     # Should take at least rate_limit_seconds between requests
-    assert elapsed >= 0.1
+    assert elapsed >= 0.25
+    assert sleeps == [pytest.approx(0.125)]
+    
+    # Once the gap has passed on its own, no sleep is needed
+    clock["now"] += 0.5
+    scraper.scrape("http://example.com")
+    assert len(sleeps) == 1
 
 
 @pytest.mark.unit
@@ -58,6 +76,19 @@ def test_base_scraper_create_result():
     assert result["metadata"]["mode"] == "TEST"
 
 
+@pytest.mark.unit
+def test_base_scraper_result_timestamp():
+    """Test result timestamps are UTC ISO-8601 with microseconds."""
+    scraper = TestScraper(mode="TEST")
+    
+    before = datetime.now(timezone.utc).replace(microsecond=0)
+    first = scraper._create_result({}, "http://example.com")["metadata"]["timestamp"]
+    second = scraper._create_result({}, "http://example.com")["metadata"]["timestamp"]
+    
+    assert len(first) == 32 and first.endswith("+00:00")
+    assert before <= datetime.fromisoformat(first) <= datetime.fromisoformat(second)
+
+
 @pytest.mark.unit
 def test_county_scraper_initialization():
     """Test county website scraper initialization."""
@@ -0,0 +1,121 @@
+"""Unit tests for storage manager."""
+
+import pytest
+from pathlib import Path
+import tempfile
+import hashlib
+import json
+
+from surplus_agents.core.storage import StorageManager, ArtifactPack
+
+
+@pytest.fixture
+def temp_storage_dir():
+    """Create a temporary directory for storage."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield Path(tmpdir)
+
+
+@pytest.mark.unit
+def test_pack_add_and_read(temp_storage_dir):
+    """Test packing artifacts and reading them back."""
+    storage = StorageManager(temp_storage_dir)
+    
+    with storage.open_pack("agent", "run-1") as pack:
+        first = pack.add_bytes("a.bin", b"hello")
+        second = pack.add_json("b.json", {"k": "v"})
+        assert first == {"offset": 0, "length": 5, "sha256": hashlib.sha256(b"hello").hexdigest()}
+        assert second["offset"] == 5
+        assert pack.read("a.bin") == b"hello"
+    
+    assert json.loads(storage.read_from_pack("agent", "run-1", "b.json")) == {"k": "v"}
+    run_dir = temp_storage_dir / "agent" / "run-1"
+    assert sorted(p.name for p in run_dir.iterdir()) == [ArtifactPack.DATA_FILE, ArtifactPack.INDEX_FILE]
+
+
+@pytest.mark.unit
+def test_pack_reopen_appends(temp_storage_dir):
+    """Test reopening a pack keeps earlier entries."""
+    storage = StorageManager(temp_storage_dir)
+    
+    with storage.open_pack("agent", "run-1") as pack:
+        pack.add_text("a.txt", "one")
+    with storage.open_pack("agent", "run-1") as pack:
+        entry = pack.add_text("b.txt", "two")
+        assert entry["offset"] == 3
+    
+    assert storage.read_from_pack("agent", "run-1", "a.txt") == b"one"
+    assert storage.read_from_pack("agent", "run-1", "b.txt") == b"two"
+
+
+@pytest.mark.unit
+def test_pack_closed_rejects_add(temp_storage_dir):
+    """Test adding to a closed pack fails."""
+    pack = StorageManager(temp_storage_dir).open_pack("agent", "run-1")
+    pack.close()
+    
+    with pytest.raises(ValueError):
+        pack.add_bytes("a.bin", b"x")
+
+
+@pytest.mark.unit
+def test_compute_hash(temp_storage_dir):
+    """Test file hashing matches hashlib."""
+    storage = StorageManager(temp_storage_dir)
+    path = storage.save_text(temp_storage_dir / "a.txt", "hello")
+    
+    assert storage.compute_hash(path) == hashlib.sha256(b"hello").hexdigest()
+
+
+@pytest.mark.unit
+def test_save_recreates_removed_directory(temp_storage_dir):
+    """Test saving into a cached directory that was removed since."""
+    import shutil
+    
+    storage = StorageManager(temp_storage_dir)
+    run_dir = storage.get_agent_dir("agent", "run-1")
+    shutil.rmtree(run_dir)
+    
+    path = storage.save_json(run_dir / "out.json", {"k": "v"})
+    assert storage.load_json(path) == {"k": "v"}
+
+
+@pytest.mark.unit
+def test_constructors_recreate_removed_directory(temp_storage_dir):
+    """Test cached directories that were removed are created again, not assumed to exist."""
+    import shutil
+    from surplus_agents.core.audit.logger import AuditLogger
+    
+    storage = StorageManager(temp_storage_dir / "base")
+    storage.get_agent_dir("agent", "run-1")
+    AuditLogger(temp_storage_dir / "audit").close()
+    shutil.rmtree(temp_storage_dir / "base")
+    shutil.rmtree(temp_storage_dir / "audit")
+    
+    storage = StorageManager(temp_storage_dir / "base")
+    assert storage.base_dir.is_dir()
+    assert storage.get_agent_dir("agent", "run-1").is_dir()
+    
+    with AuditLogger(temp_storage_dir / "audit") as logger:
+        logger.log("create", "agent1", "doc", "1", "ok")
+        shutil.rmtree(temp_storage_dir / "audit")
+        assert AuditLogger.load_from_file(logger.save()) == [logger.entries[0].to_dict()]
+
+
+@pytest.mark.unit
+def test_json_non_finite_round_trip(temp_storage_dir):
+    """Test NaN/Infinity are written as the stdlib writes them and read back."""
+    import math
+    
+    storage = StorageManager(temp_storage_dir)
+    path = storage.save_json(temp_storage_dir / "nan.json", {"a": float("nan"), "b": [float("inf"), 1.5]})
+    
+    assert b"NaN" in path.read_bytes()
+    loaded = storage.load_json(path)
+    assert math.isnan(loaded["a"])
+    assert loaded["b"] == [float("inf"), 1.5]
+    
+    # Files written by json.dump directly load the same way
+    legacy = temp_storage_dir / "legacy.json"
+    legacy.write_text(json.dumps({"x": float("-inf")}), encoding="utf-8")
+    assert storage.load_json(legacy) == {"x": float("-inf")}